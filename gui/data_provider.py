@@ -10,6 +10,20 @@ import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+# Packed per-spacecraft state: ECI-style position/velocity in km and km/s,
+# altitude in km, orbital period in minutes and inclination in degrees
+SPACECRAFT_STATE_DTYPE = np.dtype([
+    ("pos", np.float32, 3),
+    ("vel", np.float32, 3),
+    ("alt", np.float32),
+    ("period", np.float32),
+    ("incl", np.float32),
+])
+
 
 class IoSTDataProvider:
     """Central data provider for IoST GUI demonstration"""
@@ -19,6 +33,9 @@ class IoSTDataProvider:
         self.telemetry_data = {}
         self.alert_data = []
         self.cehsn_data = {}
+        # spacecraft_id -> (whole-second time bucket, read-only state record)
+        self._state_cache = {}
+        self._spacecraft_list_model = None
         self.init_demo_data()
     
     def init_demo_data(self):
@@ -313,10 +330,81 @@ class IoSTDataProvider:
         """Get list of available spacecraft"""
         return list(self.spacecraft_data.keys())
     
+    @property
+    def spacecraft_list_model(self):
+        """Shared QStringListModel of spacecraft ids for every selector widget"""
+        if self._spacecraft_list_model is None:
+            # Imported here so the provider stays usable without Qt
+            from PyQt6.QtCore import QStringListModel
+            self._spacecraft_list_model = QStringListModel(self.get_spacecraft_list())
+        return self._spacecraft_list_model
+    
+    def refresh_spacecraft_list(self):
+        """Push the current spacecraft ids to the shared list model"""
+        if self._spacecraft_list_model is not None:
+            self._spacecraft_list_model.setStringList(self.get_spacecraft_list())
+    
     def get_spacecraft_data(self, spacecraft_id: str) -> Dict[str, Any]:
         """Get data for specific spacecraft"""
         return self.spacecraft_data.get(spacecraft_id, {})
     
+    def get_spacecraft_state(self, spacecraft_id: str) -> np.ndarray:
+        """Get a spacecraft's kinematic state as a SPACECRAFT_STATE_DTYPE record
+        
+        States are cached per spacecraft for the current whole second, so every
+        widget polling the same spacecraft in one tick shares a single record.
+        The returned array is read-only.
+        """
+        t_bucket = int(time.time())
+        cached = self._state_cache.get(spacecraft_id)
+        if cached is not None and cached[0] == t_bucket:
+            return cached[1]
+        
+        state = self.get_spacecraft_states([spacecraft_id]).reshape(())
+        self._state_cache[spacecraft_id] = (t_bucket, state)
+        return state
+    
+    def get_spacecraft_states(self, spacecraft_ids: List[str]) -> np.ndarray:
+        """Get read-only SPACECRAFT_STATE_DTYPE records for many spacecraft at once
+        
+        Every spacecraft is converted in the same vectorized pass; unknown ids
+        get zeroed records.
+        """
+        states = np.zeros(len(spacecraft_ids), dtype=SPACECRAFT_STATE_DTYPE)
+        known = [i for i, spacecraft_id in enumerate(spacecraft_ids)
+                 if spacecraft_id in self.spacecraft_data]
+        if known:
+            craft = [self.spacecraft_data[spacecraft_ids[i]] for i in known]
+            lat = np.radians([c["position"]["lat"] for c in craft])
+            lon = np.radians([c["position"]["lon"] for c in craft])
+            alt = np.array([c["position"]["alt"] for c in craft])
+            speed = np.array([c["velocity"] for c in craft])
+            
+            # Simplified: spherical Earth, velocity along the local east direction
+            radius = EARTH_RADIUS_KM + alt
+            cos_lat = np.cos(lat)
+            states["pos"][known] = np.column_stack((
+                radius * cos_lat * np.cos(lon),
+                radius * cos_lat * np.sin(lon),
+                radius * np.sin(lat),
+            ))
+            states["vel"][known] = np.column_stack((
+                -speed * np.sin(lon), speed * np.cos(lon), np.zeros_like(speed)
+            ))
+            states["alt"][known] = alt
+            states["period"][known] = [c["orbital_period"] for c in craft]
+            states["incl"][known] = [c.get("inclination", 0.0) for c in craft]
+        
+        states.flags.writeable = False
+        return states
+    
+    def prefetch(self, spacecraft_ids: List[str]):
+        """Warm the state cache for several spacecraft in one batch"""
+        t_bucket = int(time.time())
+        states = self.get_spacecraft_states(spacecraft_ids)
+        for i, spacecraft_id in enumerate(spacecraft_ids):
+            self._state_cache[spacecraft_id] = (t_bucket, states[i:i + 1].reshape(()))
+    
     def get_telemetry_data(self, spacecraft_id: str, 
                           category: str = None) -> Dict[str, Any]:
         """Get telemetry data for spacecraft"""
@@ -375,6 +463,7 @@ class IoSTDataProvider:
             return
         
         spacecraft = self.spacecraft_data[spacecraft_id]
+        self._state_cache.pop(spacecraft_id, None)
         
         # Simple orbital motion simulation
         current_time = time.time()
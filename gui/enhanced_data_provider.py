@@ -10,6 +10,7 @@ import sqlite3
 import statistics
 import threading
 import time
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -298,14 +299,12 @@ class TelemetryProcessor(QObject):
             self.telemetry_buffers[spacecraft_id] = {}
         
         if parameter not in self.telemetry_buffers[spacecraft_id]:
-            self.telemetry_buffers[spacecraft_id][parameter] = []
-        
-        buffer = self.telemetry_buffers[spacecraft_id][parameter]
-        buffer.append(point.value)
+            # Bounded deque evicts the oldest value in O(1)
+            self.telemetry_buffers[spacecraft_id][parameter] = deque(
+                maxlen=self.buffer_size
+            )
         
-        # Keep buffer size limited
-        if len(buffer) > self.buffer_size:
-            buffer.pop(0)
+        self.telemetry_buffers[spacecraft_id][parameter].append(point.value)
     
     def check_telemetry_alerts(self, point: TelemetryPoint):
         """Check telemetry point against alert thresholds"""
@@ -357,7 +356,7 @@ class TelemetryProcessor(QObject):
             buffer = self.telemetry_buffers[spacecraft_id][parameter]
             
             if len(buffer) >= 5:  # Need at least 5 points
-                recent_values = buffer[-5:]
+                recent_values = [buffer[i] for i in range(-5, 0)]
                 
                 # Calculate rate of change
                 if len(set(recent_values)) > 1:  # Values are changing
@@ -713,16 +713,18 @@ class EnhancedIoSTMainWindow(QMainWindow):
         self.status_bar.addPermanentWidget(self.time_label)
     
     def init_timers(self):
-        """Initialize update timers"""
-        # Main update timer
-        self.main_timer = QTimer()
-        self.main_timer.timeout.connect(self.update_displays)
-        self.main_timer.start(5000)  # Update every 5 seconds
-        
-        # Time display timer
-        self.time_timer = QTimer()
-        self.time_timer.timeout.connect(self.update_time_display)
-        self.time_timer.start(1000)  # Update every second
+        """Initialize the single 1 Hz update timer"""
+        self._tick_count = 0
+        self.main_timer = QTimer(self)
+        self.main_timer.timeout.connect(self._on_tick)
+        self.main_timer.start(1000)  # Update every second
+    
+    def _on_tick(self):
+        """Update the clock every tick and the displays every 5 seconds"""
+        self.update_time_display()
+        self._tick_count += 1
+        if self._tick_count % 5 == 0:
+            self.update_displays()
     
     def apply_enhanced_space_theme(self):
         """Apply enhanced space-themed styling"""
@@ -930,14 +932,27 @@ class EnhancedIoSTMainWindow(QMainWindow):
     def update_spacecraft_table(self):
         """Update the spacecraft tracking table"""
         spacecraft_list = ["ISS", "Hubble", "JWST", "Dragon", "Starlink-1"]
-        self.spacecraft_table.setRowCount(len(spacecraft_list))
-        
-        for i, spacecraft in enumerate(spacecraft_list):
-            self.spacecraft_table.setItem(i, 0, QTableWidgetItem(spacecraft))
-            self.spacecraft_table.setItem(i, 1, QTableWidgetItem("Operational"))
-            self.spacecraft_table.setItem(i, 2, QTableWidgetItem("LEO"))
-            self.spacecraft_table.setItem(i, 3, QTableWidgetItem("7.66 km/s"))
-            self.spacecraft_table.setItem(i, 4, QTableWidgetItem("12:45 UTC"))
+        table = self.spacecraft_table
+        
+        # Batch the fill: no sorting, repaints or itemChanged until it is done
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(spacecraft_list))
+            for i, spacecraft in enumerate(spacecraft_list):
+                row = (spacecraft, "Operational", "LEO", "7.66 km/s", "12:45 UTC")
+                for column, text in enumerate(row):
+                    item = table.item(i, column)
+                    if item is None:
+                        table.setItem(i, column, QTableWidgetItem(text))
+                    elif item.text() != text:
+                        item.setText(text)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
     
     def update_time_display(self):
         """Update time display in status bar"""
@@ -6,7 +6,15 @@ Advanced widgets and visualization components for the IoST GUI
 
 from data_provider import data_provider
 from PyQt6.QtCore import QPropertyAnimation, QRect, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QFont, QLinearGradient, QPainter, QPen
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QLinearGradient,
+    QPainter,
+    QPainterPath,
+    QPen,
+)
 from PyQt6.QtWidgets import (
     QFrame,
     QGridLayout,
@@ -335,12 +343,40 @@ class MiniChartWidget(QWidget):
         super().__init__()
         self.data_series = data_series
         self.setMinimumSize(180, 60)
+        
+        # Data line as one path; rebuilt when the data or size changes
+        self._path = None
     
     def update_data(self, data_series):
         """Update chart data"""
         self.data_series = data_series
+        self._path = None
         self.update()
     
+    def resizeEvent(self, event):
+        """Invalidate the cached data line"""
+        self._path = None
+        super().resizeEvent(event)
+    
+    def _build_path(self, recent_data, chart_rect):
+        """Map the recent points into chart_rect as a single path"""
+        min_val = min(recent_data)
+        max_val = max(recent_data)
+        
+        if min_val == max_val:
+            min_val -= 1
+            max_val += 1
+        
+        x_step = chart_rect.width() / (len(recent_data) - 1)
+        y_scale = chart_rect.height() / (max_val - min_val)
+        bottom = chart_rect.bottom()
+        
+        path = QPainterPath()
+        path.moveTo(chart_rect.left(), bottom - (recent_data[0] - min_val) * y_scale)
+        for i, value in enumerate(recent_data[1:], 1):
+            path.lineTo(chart_rect.left() + x_step * i, bottom - (value - min_val) * y_scale)
+        return path
+    
     def paintEvent(self, event):
         """Paint the mini chart"""
         painter = QPainter(self)
@@ -352,35 +388,14 @@ class MiniChartWidget(QWidget):
         if len(self.data_series) < 2:
             return
         
-        # Calculate chart area
-        chart_rect = self.rect().adjusted(5, 5, -5, -5)
-        
-        # Find min/max values
-        min_val = min(self.data_series[-20:])  # Show last 20 points
-        max_val = max(self.data_series[-20:])
-        
-        if min_val == max_val:
-            min_val -= 1
-            max_val += 1
+        if self._path is None:
+            chart_rect = self.rect().adjusted(5, 5, -5, -5)
+            recent_data = self.data_series[-20:]  # Show last 20 points
+            self._path = self._build_path(recent_data, chart_rect)
         
         # Draw data line
         painter.setPen(QPen(QColor(0, 255, 136), 2))
-        
-        recent_data = self.data_series[-20:]  # Show last 20 points
-        for i in range(len(recent_data) - 1):
-            x1 = chart_rect.left() + (chart_rect.width() * i / 
-                                    (len(recent_data) - 1))
-            y1 = chart_rect.bottom() - (chart_rect.height() * 
-                                      (recent_data[i] - min_val) / 
-                                      (max_val - min_val))
-            
-            x2 = chart_rect.left() + (chart_rect.width() * (i + 1) / 
-                                    (len(recent_data) - 1))
-            y2 = chart_rect.bottom() - (chart_rect.height() * 
-                                      (recent_data[i + 1] - min_val) / 
-                                      (max_val - min_val))
-            
-            painter.drawLine(x1, y1, x2, y2)
+        painter.drawPath(self._path)
 
 
 class CEHSNStatusWidget(QWidget):
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Geometry Builders for the IoST 3D Viewport
+Vectorized numpy construction of interleaved position/color vertex arrays
+"""
+
+import math
+
+import numpy as np
+
+# 16-byte interleaved vertex: float32 xyz position + normalized RGBA8 color
+VERTEX_DTYPE = np.dtype([("pos", np.float32, 3), ("color", np.uint8, 4)])
+
+LAND_COLOR = np.array((77, 179, 77, 255), dtype=np.uint8)
+OCEAN_COLOR = np.array((51, 102, 204, 255), dtype=np.uint8)
+GRID_COLOR = np.array((51, 51, 51, 255), dtype=np.uint8)
+
+
+def sphere_vertices(radius, lon_segments, lat_segments):
+    """Create vertices for a sphere"""
+    # Same angle formulas as a per-vertex loop, evaluated for the whole grid at once
+    lat = math.pi * np.arange(lat_segments + 1) / lat_segments - math.pi / 2
+    lon = 2 * math.pi * np.arange(lon_segments + 1) / lon_segments
+    lat_angle, lon_angle = np.meshgrid(lat, lon, indexing='ij')
+    
+    vertices = np.empty((lat_segments + 1, lon_segments + 1), dtype=VERTEX_DTYPE)
+    position = vertices["pos"]
+    cos_lat = np.cos(lat_angle)
+    position[..., 0] = radius * cos_lat * np.cos(lon_angle)
+    position[..., 1] = radius * cos_lat * np.sin(lon_angle)
+    position[..., 2] = radius * np.sin(lat_angle)
+    
+    # Earth-like coloring: green for land, blue for oceans. Color depends only
+    # on latitude, so select once per ring and broadcast along longitude
+    ring_colors = np.where((lat > 0)[:, np.newaxis], LAND_COLOR, OCEAN_COLOR)
+    vertices["color"] = ring_colors[:, np.newaxis, :]
+    
+    return vertices.reshape(-1)
+
+
+def sphere_indices(lon_segments, lat_segments):
+    """Create uint16 triangle-strip indices for sphere_vertices' grid"""
+    ring = lon_segments + 1
+    band = np.arange(lat_segments)[:, np.newaxis] * ring + np.arange(ring)
+    
+    # Each band zigzags between two rings; two repeated indices per band
+    # form degenerate triangles that stitch it to the next band
+    strips = np.empty((lat_segments, 2 * ring + 2), dtype=np.uint16)
+    strips[:, 0:2 * ring:2] = band
+    strips[:, 1:2 * ring:2] = band + ring
+    strips[:, -2] = strips[:, 2 * ring - 1]
+    strips[:, -1] = np.roll(strips[:, 0], -1)
+    
+    return strips.reshape(-1)[:-2]
+
+
+def cube_vertices(size):
+    """Create the eight corner vertices of a cube (spacecraft)"""
+    half_size = size / 2
+    vertices = [
+        # Front face (red)
+        ((-half_size, -half_size,  half_size), (255, 0, 0, 255)),
+        (( half_size, -half_size,  half_size), (255, 0, 0, 255)),
+        (( half_size,  half_size,  half_size), (255, 0, 0, 255)),
+        ((-half_size,  half_size,  half_size), (255, 0, 0, 255)),
+        
+        # Back face (green)
+        ((-half_size, -half_size, -half_size), (0, 255, 0, 255)),
+        (( half_size, -half_size, -half_size), (0, 255, 0, 255)),
+        (( half_size,  half_size, -half_size), (0, 255, 0, 255)),
+        ((-half_size,  half_size, -half_size), (0, 255, 0, 255)),
+    ]
+    
+    return np.array(vertices, dtype=VERTEX_DTYPE)
+
+
+def cube_indices():
+    """Create uint16 triangle indices for cube_vertices' eight corners"""
+    return np.array([
+        0, 1, 2, 2, 3, 0,  # front
+        5, 4, 7, 7, 6, 5,  # back
+        4, 0, 3, 3, 7, 4,  # left
+        1, 5, 6, 6, 2, 1,  # right
+        3, 2, 6, 6, 7, 3,  # top
+        4, 5, 1, 1, 0, 4,  # bottom
+    ], dtype=np.uint16)
+
+
+def grid_vertices(size, spacing):
+    """Create vertices for a 3D grid"""
+    half_size = size / 2
+    ticks = np.arange(-int(half_size), int(half_size) + 1, spacing)
+    outer, inner = np.meshgrid(ticks, ticks, indexing='ij')
+    outer = outer.reshape(-1, 1)
+    inner = inner.reshape(-1, 1)
+    
+    # One (line, endpoint) block of vertices per axis the lines run along
+    segments = np.empty((3, outer.shape[0], 2), dtype=VERTEX_DTYPE)
+    segments["color"] = GRID_COLOR
+    for axis in range(3):
+        lines = segments["pos"][axis]
+        lines[:, 0, axis] = -half_size
+        lines[:, 1, axis] = half_size
+        first, second = (i for i in range(3) if i != axis)
+        lines[:, :, first] = outer
+        lines[:, :, second] = inner
+    
+    return segments.reshape(-1)
@@ -183,7 +183,14 @@ def main():
     # Check Python version
     if not check_python_version():
         return 1
-    
+
+    # Standard mode only needs PyQt6 - skip the full dependency scan
+    if mode == "standard" and not install_deps and (
+        "PyQt6" in sys.modules or importlib.util.find_spec("PyQt6")
+    ):
+        print("\nPyQt6 available, skipping dependency scan")
+        return launch_gui("standard")
+
     # Install dependencies if requested
     if install_deps:
         print("\nInstalling all dependencies...")
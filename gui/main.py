@@ -4,64 +4,56 @@ Internet of Space Things (IoST) - Main GUI Application
 PyQt6-based comprehensive interface for mission control and system monitoring
 """
 
+import importlib
 import os
 import sys
-from pathlib import Path
+import time
+from array import array
+from collections import deque
 
 from PyQt6.QtCore import (
-    QDate,
-    QDateTime,
-    QEasingCurve,
-    QMutex,
+    QAbstractTableModel,
+    QModelIndex,
     QObject,
     QPoint,
-    QPropertyAnimation,
+    QPointF,
     QRect,
+    QRectF,
+    QRegularExpression,
     QRunnable,
-    QSize,
+    QSignalBlocker,
+    QStringListModel,
     Qt,
     QThread,
     QThreadPool,
-    QTime,
     QTimer,
-    QWaitCondition,
     pyqtSignal,
 )
 from PyQt6.QtGui import (
     QAction,
     QBrush,
     QColor,
-    QCursor,
-    QDoubleValidator,
     QFont,
+    QFontMetrics,
     QIcon,
-    QIntValidator,
-    QKeySequence,
-    QLinearGradient,
-    QMovie,
+    QImage,
     QPainter,
-    QPalette,
     QPen,
     QPixmap,
-    QRadialGradient,
+    QPixmapCache,
+    QPolygon,
     QRegularExpressionValidator,
-    QValidator,
+    QStaticText,
+    QTextCursor,
+    QTransform,
 )
 from PyQt6.QtWidgets import (
     QApplication,
-    QButtonGroup,
-    QCalendarWidget,
     QCheckBox,
     QComboBox,
-    QDateTimeEdit,
-    QDial,
-    QDialog,
-    QDialogButtonBox,
     QDoubleSpinBox,
+    QFormLayout,
     QFrame,
-    QGraphicsItem,
-    QGraphicsScene,
-    QGraphicsView,
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
@@ -69,26 +61,14 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QListWidget,
     QMainWindow,
-    QMenuBar,
-    QMessageBox,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
-    QRadioButton,
-    QScrollArea,
-    QSizePolicy,
-    QSlider,
     QSpinBox,
     QSplitter,
-    QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
-    QTextBrowser,
     QTextEdit,
-    QTimeEdit,
-    QToolBar,
-    QTreeWidget,
-    QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
@@ -96,31 +76,444 @@ from PyQt6.QtWidgets import (
 # Add src to Python path for importing IoST modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-# Import IoST system components
+# Optional numpy acceleration for telemetry trace rasterization
 try:
-    from cehsn.ethics_engine import EthicsEngine
-    from cehsn.orbital_infer import OrbitalInferenceEngine
-    from cehsn.resilience_monitor import ResilienceMonitor
-    from cehsn.rpa_comm_bridge import RPACommunicationBridge
-    from cehsn.survival_mapgen import SurvivalMapGenerator
-    from communication.multiband_radio import FrequencyBand, MultibandRadio
-    from core.mission_control import MissionControl
-    from core.satellite_manager import SatelliteManager
-    from core.space_network import SpaceNetwork
-    from cubesat.cubesat_network import CubeSat, CubeSatSize
-    from cubesat.sdn_controller import SDNController
-except ImportError as e:
-    print(f"Warning: Could not import IoST modules: {e}")
-    print("GUI will run in demonstration mode")
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional pyqtgraph backend for the map views
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
+# Optional host metrics for the diagnostics tab
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# IoST subsystems, imported and constructed on demand by worker threads:
+# (attribute, module, class, constructor args)
+_IOST_SYSTEMS = (
+    # Core systems
+    ("mission_control", "core.mission_control", "MissionControl", ()),
+    ("satellite_manager", "core.satellite_manager", "SatelliteManager", ()),
+    ("space_network", "core.space_network", "SpaceNetwork", ()),
+    # CEHSN components
+    ("orbital_inference", "cehsn.orbital_infer", "OrbitalInferenceEngine", ()),
+    ("rpa_bridge", "cehsn.rpa_comm_bridge", "RPACommunicationBridge", ()),
+    ("ethics_engine", "cehsn.ethics_engine", "EthicsEngine", ()),
+    ("survival_mapgen", "cehsn.survival_mapgen", "SurvivalMapGenerator", ()),
+    ("resilience_monitor", "cehsn.resilience_monitor", "ResilienceMonitor", ()),
+    # Communication systems
+    ("sdn_controller", "cubesat.sdn_controller", "SDNController", ("GUI_SDN",)),
+)
+
+
+# Link capacity the network usage bar is scaled against (100 Mbit/s)
+_NETWORK_CAPACITY_BYTES = 100e6 / 8
+
+# Space theme, applied once on the QApplication and shared by all windows
+_SPACE_QSS = """
+QMainWindow {
+    background-color: #1a1a2e;
+    color: #ffffff;
+}
+
+QTabWidget::pane {
+    border: 2px solid #3a3a5c;
+    background-color: #16213e;
+}
+
+QTabBar::tab {
+    background-color: #0f3460;
+    color: #ffffff;
+    padding: 8px 16px;
+    margin: 2px;
+    border-radius: 4px;
+}
+
+QTabBar::tab:selected {
+    background-color: #e94560;
+}
+
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #3a3a5c;
+    border-radius: 8px;
+    margin: 5px;
+    padding-top: 10px;
+    background-color: #16213e;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+    color: #ffffff;
+}
+
+QPushButton {
+    background-color: #0f3460;
+    color: #ffffff;
+    border: 2px solid #3a3a5c;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-weight: bold;
+}
+
+QPushButton:hover {
+    background-color: #e94560;
+}
+
+QPushButton:pressed {
+    background-color: #c73650;
+}
+
+QProgressBar {
+    border: 2px solid #3a3a5c;
+    border-radius: 5px;
+    text-align: center;
+    color: #ffffff;
+    font-weight: bold;
+}
+
+QProgressBar::chunk {
+    background-color: #00ff88;
+    border-radius: 3px;
+}
+
+QTableView {
+    background-color: #16213e;
+    color: #ffffff;
+    gridline-color: #3a3a5c;
+    border: 1px solid #3a3a5c;
+}
+
+QHeaderView::section {
+    background-color: #0f3460;
+    color: #ffffff;
+    padding: 6px;
+    border: 1px solid #3a3a5c;
+    font-weight: bold;
+}
+
+QListWidget {
+    background-color: #16213e;
+    color: #ffffff;
+    border: 1px solid #3a3a5c;
+}
+
+QTextEdit, QPlainTextEdit {
+    background-color: #16213e;
+    color: #ffffff;
+    border: 1px solid #3a3a5c;
+}
+
+QComboBox {
+    background-color: #0f3460;
+    color: #ffffff;
+    border: 1px solid #3a3a5c;
+    padding: 4px;
+}
+
+QLineEdit {
+    background-color: #16213e;
+    color: #ffffff;
+    border: 1px solid #3a3a5c;
+    padding: 4px;
+}
+
+QSpinBox, QDoubleSpinBox {
+    background-color: #16213e;
+    color: #ffffff;
+    border: 1px solid #3a3a5c;
+}
+"""
+
+# Shared widget stylesheets, parsed once per unique string
+_QSS_STATUS_HEADER = "font-size: 16px; font-weight: bold; color: green;"
+_QSS_STATUS_OK = "color: green;"
+_QSS_STATUS_OK_BOLD = "color: green; font-weight: bold;"
+_QSS_EMERGENCY_BTN = "background-color: #ff4444; color: white; font-weight: bold;"
+_QSS_EMERGENCY_FRAME = "background-color: #ff4444; color: white; padding: 10px; border-radius: 5px;"
+_QSS_EVAC_BTN = "background-color: #ff6600; color: white; font-weight: bold;"
+
+# Demo spacecraft shown on the tracking map: (name, x, y, status)
+_DEMO_SPACECRAFT = (
+    ("ISS", 150, 100, "operational"),
+    ("Luna Gateway", 400, 200, "operational"),
+    ("Crew Dragon", 200, 150, "operational"),
+    ("CubeSat-1", 300, 80, "operational"),
+    ("CubeSat-2", 500, 120, "warning"),
+)
+
+# Demo survival map zones: (x, y, diameter) bounding circles
+_DEMO_HAZARD_ZONES = ((50, 50, 100), (300, 200, 80))
+_DEMO_SAFE_ZONES = ((400, 50, 120), (100, 300, 100))
+_DEMO_SAFE_ROUTE = ((20, 20), (450, 100), (150, 350))
+# Survival map hazard levels as RGB: 0 = clear, 1 = safe zone, 2 = hazard zone
+_HAZARD_LUT = ((240, 240, 240), (170, 240, 170), (250, 170, 170))
+_DEMO_MAP_LABELS = (
+    (70, 105, "Fire Zone"),
+    (320, 245, "Flood Risk"),
+    (430, 115, "Safe Zone"),
+    (125, 355, "Shelter"),
+)
+
+# Shared paint colours for the custom-drawn widgets
+_WHITE = QColor(255, 255, 255)
+_BLACK = QColor(0, 0, 0)
+_SPACE_BG = QColor(10, 10, 30)
+_CHART_BG = QColor(22, 33, 62)
+_MAP_BG = QColor(240, 240, 240)
+_GREEN = QColor(0, 255, 0)
+_YELLOW = QColor(255, 255, 0)
+_TREND = QColor(0, 255, 136)
+_ORBIT = QColor(100, 100, 150)
+_EARTH = QColor(100, 150, 255)
+_HAZARD_FILL = QColor(255, 100, 100, 128)
+_HAZARD_EDGE = QColor(255, 0, 0)
+_SAFE_FILL = QColor(100, 255, 100, 128)
+_SAFE_EDGE = _GREEN
+_ROUTE = QColor(0, 100, 255)
+
+# Status label attribute, title and ready state per CEHSN subsystem
+_CEHSN_STATUS_LABELS = {
+    "orbital_inference": ("orbital_inference_status", "🔍 Orbital Inference", "Active"),
+    "rpa_bridge": ("rpa_bridge_status", "🚁 RPA Bridge", "Connected"),
+    "ethics_engine": ("ethics_engine_status", "⚖️ Ethics Engine", "Operational"),
+    "survival_mapgen": ("survival_map_status", "🗺️ Survival Maps", "Generating"),
+    "resilience_monitor": ("resilience_monitor_status", "🛡️ Resilience Monitor", "Monitoring"),
+}
+
+# Menu bar and toolbar actions as (text, shortcut, slot); None is a separator
+_MENU_SPEC = (
+    ('File', (
+        ('Export Report', None, 'export_report'),
+        None,
+        ('Exit', 'Ctrl+Q', 'close'),
+    )),
+    ('View', (('Fullscreen', 'F11', 'toggle_fullscreen'),)),
+    ('Tools', (('Settings', None, 'open_settings'),)),
+    ('Help', (('About IoST', None, 'show_about'),)),
+)
+_TOOLBAR_SPEC = (
+    ('Emergency', 'emergency', 'trigger_emergency'),
+    None,
+    ('Refresh', 'refresh', 'refresh_all_data'),
+    ('Screenshot', 'screenshot', 'take_screenshot'),
+)
+
+# Input validators, compiled once and shared by reference
+_COMMAND_RE = QRegularExpression(r"^[A-Za-z][\w.\-]*(\s+\S.*)?$")
+_COMMAND_VALIDATOR = QRegularExpressionValidator(_COMMAND_RE)
+
+# Status and action glyphs, rendered to pixmaps on first use
+_STATUS_GLYPHS = {"nominal": "🟢", "warning": "🟡", "critical": "🔴"}
+_ACTION_GLYPHS = {"emergency": "🚨", "refresh": "🔄", "screenshot": "📸"}
+_icons = {}
+
+
+def _glyph_pixmap(glyph, size=20):
+    """Render an emoji glyph to a pixmap, cached in QPixmapCache"""
+    key = f"iost-glyph:{glyph}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(QFont("Noto Color Emoji", 14))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _icon(name):
+    """Shared QIcon for a toolbar/menu action glyph"""
+    icon = _icons.get(name)
+    if icon is None:
+        icon = _icons.setdefault(name, QIcon(_glyph_pixmap(_ACTION_GLYPHS[name])))
+    return icon
+
+
+def _preload_glyphs():
+    """Rasterize all status/action glyphs up front so the first flip is a cache hit"""
+    for glyph in (*_STATUS_GLYPHS.values(), *_ACTION_GLYPHS.values()):
+        _glyph_pixmap(glyph)
+
+
+def _combo(items):
+    """Create a combo box populated from a detached string list model"""
+    combo = QComboBox()
+    combo.setModel(QStringListModel(items, combo))
+    return combo
+
+
+def _form_layout(parent):
+    """Create a compact label/field form layout"""
+    form = QFormLayout(parent)
+    form.setContentsMargins(0, 0, 0, 0)
+    form.setSpacing(4)
+    return form
+
+
+def _set_opaque_painting(widget):
+    """Skip Qt's background fill for widgets whose paintEvent covers every pixel"""
+    widget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+    widget.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+    widget.setAutoFillBackground(False)
+
+
+def _round_pen(color, width):
+    """Pen whose drawPoints() output is a filled disc of the given diameter"""
+    pen = QPen(color, width)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    return pen
+
+
+def _static_label(text, font):
+    """QStaticText with its glyph layout prepared once for the given font"""
+    label = QStaticText(text)
+    label.prepare(QTransform(), font)
+    return label
+
+
+def _make_log_view(lines, max_lines=500):
+    """Create a bounded read-only log view and a cursor parked at its end"""
+    log = QPlainTextEdit()
+    log.setReadOnly(True)
+    log.setMaximumBlockCount(max_lines)
+    log.setPlainText("\n".join(lines))
+    
+    cursor = log.textCursor()
+    cursor.movePosition(QTextCursor.MoveOperation.End)
+    return log, cursor
+
+
+def _append_log_line(cursor, line):
+    """Append a line through a cached cursor without re-laying out the document"""
+    if not cursor.atStart():
+        cursor.insertBlock()
+    cursor.insertText(line)
+
+
+class _SystemSignals(QObject):
+    """Signals emitted by background system initialization"""
+    
+    done = pyqtSignal(str, object)
+
+
+class _SysInit(QRunnable):
+    """Import and construct a single IoST subsystem on a worker thread"""
+    
+    def __init__(self, name, module, class_name, args):
+        super().__init__()
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.args = args
+        self.signals = _SystemSignals()
+    
+    def run(self):
+        try:
+            system_class = getattr(importlib.import_module(self.module), self.class_name)
+            system = system_class(*self.args)
+        except Exception as e:
+            print(f"Warning: {self.name} unavailable, running in demonstration mode: {e}")
+            system = None
+        self.signals.done.emit(self.name, system)
+
+
+class _TaskSignals(QObject):
+    """Signals emitted by background GUI actions"""
+    
+    status = pyqtSignal(str, int)
+
+
+class _Task(QRunnable):
+    """Run a slow GUI action on a worker thread, reporting back as status text"""
+    
+    def __init__(self, fn, done_message, timeout=2000):
+        super().__init__()
+        self.fn = fn
+        self.done_message = done_message
+        self.timeout = timeout
+        self.signals = _TaskSignals()
+    
+    def run(self):
+        try:
+            self.fn()
+            message = self.done_message
+        except Exception as e:
+            message = f"Failed: {e}"
+        self.signals.status.emit(message, self.timeout)
+
+
+def _save_image(image, path):
+    """Write a QImage to disk, raising on failure"""
+    if not image.save(path):
+        raise OSError(f"could not write {path}")
+
+
+def _write_report(lines, path):
+    """Write report lines to a text file"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+class PerfProbe(QObject):
+    """Samples host CPU, memory and network usage once per second"""
+    
+    sample = pyqtSignal(int, int, int)
+    
+    def __init__(self, interval=1.0):
+        super().__init__()
+        self.interval = interval
+        self._stop = False
+    
+    def stop(self):
+        """Ask the sampling loop to exit after the current interval"""
+        self._stop = True
+    
+    def run(self):
+        """Sampling loop; runs on the probe's QThread"""
+        last_bytes = self._net_bytes()
+        psutil.cpu_percent()  # Prime the CPU counter
+        while not self._stop:
+            time.sleep(self.interval)
+            cpu = int(psutil.cpu_percent())
+            mem = int(psutil.virtual_memory().percent)
+            
+            net_bytes = self._net_bytes()
+            rate = (net_bytes - last_bytes) / self.interval
+            last_bytes = net_bytes
+            net = int(min(rate / _NETWORK_CAPACITY_BYTES * 100, 100))
+            
+            self.sample.emit(cpu, mem, net)
+    
+    @staticmethod
+    def _net_bytes():
+        counters = psutil.net_io_counters()
+        return counters.bytes_sent + counters.bytes_recv
 
 
 class IoSTMainWindow(QMainWindow):
     """Main window for Internet of Space Things GUI"""
     
+    _TIME_FMT = "%Y-%m-%d %H:%M:%S UTC"
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Internet of Space Things (IoST) - Mission Control")
         self.setGeometry(100, 100, 1600, 1000)
+        _preload_glyphs()
         
         # Initialize IoST system components
         self.init_iost_systems()
@@ -133,57 +526,102 @@ class IoSTMainWindow(QMainWindow):
         
         # Start real-time updates
         self.init_timers()
-        
-        # Apply styling
-        self.apply_space_theme()
+        self.init_perf_probe()
     
     def init_iost_systems(self):
-        """Initialize IoST system components"""
-        try:
-            # Core systems
-            self.mission_control = MissionControl()
-            self.satellite_manager = SatelliteManager()
-            self.space_network = SpaceNetwork()
+        """Initialize IoST system components on the global thread pool"""
+        self.systems_initialized = False
+        self._pending_systems = set()
+        self._failed_systems = set()
+        
+        pool = QThreadPool.globalInstance()
+        for name, module, class_name, args in _IOST_SYSTEMS:
+            setattr(self, name, None)
+            self._pending_systems.add(name)
             
-            # CEHSN components
-            self.orbital_inference = OrbitalInferenceEngine()
-            self.rpa_bridge = RPACommunicationBridge()
-            self.ethics_engine = EthicsEngine()
-            self.survival_mapgen = SurvivalMapGenerator()
-            self.resilience_monitor = ResilienceMonitor()
-            
-            # Communication systems
-            self.sdn_controller = SDNController("GUI_SDN")
-            
-            self.systems_initialized = True
-            
-        except Exception as e:
-            print(f"Error initializing IoST systems: {e}")
-            self.systems_initialized = False
+            job = _SysInit(name, module, class_name, args)
+            job.signals.done.connect(self._on_system_initialized)
+            pool.start(job)
+    
+    def _on_system_initialized(self, name, system):
+        """Store a subsystem constructed on a worker thread"""
+        setattr(self, name, system)
+        self._pending_systems.discard(name)
+        if system is None:
+            self._failed_systems.add(name)
+        
+        if name in _CEHSN_STATUS_LABELS:
+            label = getattr(self, _CEHSN_STATUS_LABELS[name][0], None)
+            if label is not None:
+                label.setText(self._system_status_text(name))
+        
+        if not self._pending_systems:
+            self.systems_initialized = not self._failed_systems
+    
+    def _system_status_text(self, name):
+        """Status label text for a CEHSN subsystem"""
+        _, title, state = _CEHSN_STATUS_LABELS[name]
+        if name in self._pending_systems:
+            return f"{title}: ⏳ Initializing"
+        if name in self._failed_systems:
+            return f"{title}: {_STATUS_GLYPHS['critical']} Failed"
+        return f"{title}: {_STATUS_GLYPHS['nominal']} {state}"
     
     def init_ui(self):
         """Initialize the main user interface"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
+        # Suppress intermediate paints/layouts while the tabs are built
+        self.setUpdatesEnabled(False)
+        central_widget.setUpdatesEnabled(False)
+        
         # Main layout
         main_layout = QVBoxLayout(central_widget)
         
         # Create tab widget for different sections
         self.tab_widget = QTabWidget()
+        self.tab_widget.blockSignals(True)
         main_layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self.create_mission_control_tab()
-        self.create_satellite_management_tab()
-        self.create_cehsn_operations_tab()
-        self.create_telemetry_monitoring_tab()
-        self.create_emergency_response_tab()
-        self.create_system_diagnostics_tab()
+        # Add placeholder tabs; each one is populated on first visit
+        self._tab_builders = {}
+        for title, builder in (
+            ("🏠 Mission Control", self.create_mission_control_tab),
+            ("🛰️ Satellites", self.create_satellite_management_tab),
+            ("⚡ CEHSN", self.create_cehsn_operations_tab),
+            ("📊 Telemetry", self.create_telemetry_monitoring_tab),
+            ("🚨 Emergency", self.create_emergency_response_tab),
+            ("🔧 Diagnostics", self.create_system_diagnostics_tab),
+        ):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        
+        self.tab_widget.blockSignals(False)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        self._on_tab_changed(self.tab_widget.currentIndex())
+        
+        central_widget.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
+        central_widget.updateGeometry()
     
-    def create_mission_control_tab(self):
+    def _on_tab_changed(self, index):
+        """Build a tab's contents the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        tab = self.tab_widget.widget(index)
+        tab.setUpdatesEnabled(False)
+        builder(tab)
+        tab.setUpdatesEnabled(True)
+        
+        # Every tab is built; stop listening for first activations
+        if not self._tab_builders:
+            self.tab_widget.currentChanged.disconnect(self._on_tab_changed)
+    
+    def create_mission_control_tab(self, tab):
         """Create mission control dashboard tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Top status panel
@@ -191,9 +629,17 @@ class IoSTMainWindow(QMainWindow):
         status_layout = QGridLayout(status_group)
         
         # System status indicators
-        self.system_status_label = QLabel("🟢 All Systems Nominal")
-        self.system_status_label.setStyleSheet("font-size: 16px; font-weight: bold; color: green;")
-        status_layout.addWidget(self.system_status_label, 0, 0)
+        # Glyph and text are separate so a status flip only swaps a cached pixmap
+        system_status_layout = QHBoxLayout()
+        system_status_layout.setContentsMargins(0, 0, 0, 0)
+        self.system_status_icon = QLabel()
+        system_status_layout.addWidget(self.system_status_icon)
+        self.system_status_label = QLabel()
+        self.system_status_label.setStyleSheet(_QSS_STATUS_HEADER)
+        system_status_layout.addWidget(self.system_status_label)
+        system_status_layout.addStretch()
+        status_layout.addLayout(system_status_layout, 0, 0)
+        self.set_system_status("nominal", "All Systems Nominal")
         
         self.spacecraft_count_label = QLabel("Active Spacecraft: 15")
         status_layout.addWidget(self.spacecraft_count_label, 0, 1)
@@ -210,7 +656,7 @@ class IoSTMainWindow(QMainWindow):
         map_group = QGroupBox("Real-time Spacecraft Tracking")
         map_layout = QVBoxLayout(map_group)
         
-        self.spacecraft_map = SpacecraftMapWidget()
+        self.spacecraft_map = SpacecraftMapPlot() if PYQTGRAPH_AVAILABLE else SpacecraftMapWidget()
         map_layout.addWidget(self.spacecraft_map)
         
         control_splitter.addWidget(map_group)
@@ -224,7 +670,7 @@ class IoSTMainWindow(QMainWindow):
         quick_layout = QGridLayout(quick_actions_group)
         
         self.emergency_btn = QPushButton("🚨 Emergency Protocol")
-        self.emergency_btn.setStyleSheet("background-color: #ff4444; color: white; font-weight: bold;")
+        self.emergency_btn.setStyleSheet(_QSS_EMERGENCY_BTN)
         quick_layout.addWidget(self.emergency_btn, 0, 0)
         
         self.manual_command_btn = QPushButton("💻 Manual Command")
@@ -252,20 +698,16 @@ class IoSTMainWindow(QMainWindow):
         
         control_splitter.addWidget(control_group)
         layout.addWidget(control_splitter)
-        
-        self.tab_widget.addTab(tab, "🏠 Mission Control")
     
-    def create_satellite_management_tab(self):
+    def create_satellite_management_tab(self, tab):
         """Create satellite management tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Satellite selection and overview
         selection_group = QGroupBox("Spacecraft Selection")
         selection_layout = QHBoxLayout(selection_group)
         
-        self.satellite_combo = QComboBox()
-        self.satellite_combo.addItems([
+        self.satellite_combo = _combo([
             "ISS (International Space Station)",
             "Luna Gateway",
             "Crew Dragon DM-2",
@@ -301,19 +743,16 @@ class IoSTMainWindow(QMainWindow):
         
         # Configuration controls
         config_group = QGroupBox("Configuration")
-        config_layout = QGridLayout(config_group)
+        config_layout = _form_layout(config_group)
         
-        config_layout.addWidget(QLabel("Power Mode:"), 0, 0)
-        self.power_mode_combo = QComboBox()
-        self.power_mode_combo.addItems(["Normal", "Power Save", "High Performance"])
-        config_layout.addWidget(self.power_mode_combo, 0, 1)
+        self.power_mode_combo = _combo(["Normal", "Power Save", "High Performance"])
+        config_layout.addRow("Power Mode:", self.power_mode_combo)
         
-        config_layout.addWidget(QLabel("Communication Freq:"), 1, 0)
         self.comm_freq_spin = QDoubleSpinBox()
         self.comm_freq_spin.setRange(2.0, 40.0)
         self.comm_freq_spin.setValue(8.4)
         self.comm_freq_spin.setSuffix(" GHz")
-        config_layout.addWidget(self.comm_freq_spin, 1, 1)
+        config_layout.addRow("Communication Freq:", self.comm_freq_spin)
         
         controls_layout.addWidget(config_group)
         
@@ -323,6 +762,7 @@ class IoSTMainWindow(QMainWindow):
         
         self.command_input = QLineEdit()
         self.command_input.setPlaceholderText("Enter command...")
+        self.command_input.setValidator(_COMMAND_VALIDATOR)
         command_layout.addWidget(self.command_input)
         
         command_buttons_layout = QHBoxLayout()
@@ -339,12 +779,9 @@ class IoSTMainWindow(QMainWindow):
         
         details_splitter.addWidget(controls_group)
         layout.addWidget(details_splitter)
-        
-        self.tab_widget.addTab(tab, "🛰️ Satellites")
     
-    def create_cehsn_operations_tab(self):
+    def create_cehsn_operations_tab(self, tab):
         """Create CEHSN operations tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # CEHSN overview
@@ -354,19 +791,19 @@ class IoSTMainWindow(QMainWindow):
         # CEHSN status indicators
         status_grid = QGridLayout()
         
-        self.orbital_inference_status = QLabel("🔍 Orbital Inference: 🟢 Active")
+        self.orbital_inference_status = QLabel(self._system_status_text("orbital_inference"))
         status_grid.addWidget(self.orbital_inference_status, 0, 0)
         
-        self.rpa_bridge_status = QLabel("🚁 RPA Bridge: 🟢 Connected")
+        self.rpa_bridge_status = QLabel(self._system_status_text("rpa_bridge"))
         status_grid.addWidget(self.rpa_bridge_status, 0, 1)
         
-        self.ethics_engine_status = QLabel("⚖️ Ethics Engine: 🟢 Operational")
+        self.ethics_engine_status = QLabel(self._system_status_text("ethics_engine"))
         status_grid.addWidget(self.ethics_engine_status, 1, 0)
         
-        self.survival_map_status = QLabel("🗺️ Survival Maps: 🟢 Generating")
+        self.survival_map_status = QLabel(self._system_status_text("survival_mapgen"))
         status_grid.addWidget(self.survival_map_status, 1, 1)
         
-        self.resilience_monitor_status = QLabel("🛡️ Resilience Monitor: 🟢 Monitoring")
+        self.resilience_monitor_status = QLabel(self._system_status_text("resilience_monitor"))
         status_grid.addWidget(self.resilience_monitor_status, 2, 0)
         
         overview_layout.addLayout(status_grid)
@@ -391,8 +828,6 @@ class IoSTMainWindow(QMainWindow):
         self.create_resilience_monitor_tab(cehsn_tabs)
         
         layout.addWidget(cehsn_tabs)
-        
-        self.tab_widget.addTab(tab, "⚡ CEHSN")
     
     def create_orbital_inference_tab(self, parent_tabs):
         """Create orbital inference engine tab"""
@@ -403,11 +838,6 @@ class IoSTMainWindow(QMainWindow):
         predictions_group = QGroupBox("AI Predictions")
         predictions_layout = QVBoxLayout(predictions_group)
         
-        self.predictions_table = QTableWidget(5, 4)
-        self.predictions_table.setHorizontalHeaderLabels([
-            "Event Type", "Confidence", "Time to Event", "Recommended Action"
-        ])
-        
         # Sample predictions
         predictions = [
             ("Solar Particle Event", "94.7%", "8h 23m", "Activate radiation shielding"),
@@ -417,11 +847,11 @@ class IoSTMainWindow(QMainWindow):
             ("Thermal Anomaly", "67.2%", "1d 14h", "Adjust cooling system")
         ]
         
-        for i, (event, conf, time, action) in enumerate(predictions):
-            self.predictions_table.setItem(i, 0, QTableWidgetItem(event))
-            self.predictions_table.setItem(i, 1, QTableWidgetItem(conf))
-            self.predictions_table.setItem(i, 2, QTableWidgetItem(time))
-            self.predictions_table.setItem(i, 3, QTableWidgetItem(action))
+        self.predictions_model = RowTableModel(predictions, [
+            "Event Type", "Confidence", "Time to Event", "Recommended Action"
+        ])
+        self.predictions_table = QTableView()
+        self.predictions_table.setModel(self.predictions_model)
         
         predictions_layout.addWidget(self.predictions_table)
         layout.addWidget(predictions_group)
@@ -449,30 +879,26 @@ class IoSTMainWindow(QMainWindow):
         
         # Mission deployment
         mission_group = QGroupBox("RPA Mission Deployment")
-        mission_layout = QGridLayout(mission_group)
+        mission_layout = _form_layout(mission_group)
         
-        mission_layout.addWidget(QLabel("Mission Type:"), 0, 0)
-        self.mission_type_combo = QComboBox()
-        self.mission_type_combo.addItems([
+        self.mission_type_combo = _combo([
             "Search and Rescue",
             "Environmental Survey",
             "Supply Delivery",
             "Communication Relay"
         ])
-        mission_layout.addWidget(self.mission_type_combo, 0, 1)
+        mission_layout.addRow("Mission Type:", self.mission_type_combo)
         
-        mission_layout.addWidget(QLabel("Area of Interest:"), 1, 0)
         self.area_input = QLineEdit("Emergency Zone Alpha")
-        mission_layout.addWidget(self.area_input, 1, 1)
+        mission_layout.addRow("Area of Interest:", self.area_input)
         
-        mission_layout.addWidget(QLabel("Drone Count:"), 2, 0)
         self.drone_count_spin = QSpinBox()
         self.drone_count_spin.setRange(1, 50)
         self.drone_count_spin.setValue(3)
-        mission_layout.addWidget(self.drone_count_spin, 2, 1)
+        mission_layout.addRow("Drone Count:", self.drone_count_spin)
         
         self.deploy_mission_btn = QPushButton("🚀 Deploy Mission")
-        mission_layout.addWidget(self.deploy_mission_btn, 3, 0, 1, 2)
+        mission_layout.addRow(self.deploy_mission_btn)
         
         layout.addWidget(mission_group)
         
@@ -534,8 +960,7 @@ class IoSTMainWindow(QMainWindow):
         results_group = QGroupBox("Ethical Analysis Results")
         results_layout = QVBoxLayout(results_group)
         
-        self.ethics_results = QTextBrowser()
-        self.ethics_results.setHtml("""
+        self.ethics_results = QLabel("""
         <h3>Sample Ethical Analysis</h3>
         <p><strong>Scenario:</strong> Resource allocation during emergency</p>
         <h4>Utilitarian Analysis (Score: 8.7/10)</h4>
@@ -546,6 +971,9 @@ class IoSTMainWindow(QMainWindow):
         <p>Based on multi-framework analysis, prioritize immediate life support systems
         while maintaining communication with affected personnel.</p>
         """)
+        self.ethics_results.setTextFormat(Qt.TextFormat.RichText)
+        self.ethics_results.setWordWrap(True)
+        self.ethics_results.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         results_layout.addWidget(self.ethics_results)
         
         layout.addWidget(results_group)
@@ -559,13 +987,11 @@ class IoSTMainWindow(QMainWindow):
         
         # Map generation controls
         controls_group = QGroupBox("Survival Map Generation")
-        controls_layout = QGridLayout(controls_group)
+        controls_layout = _form_layout(controls_group)
         
-        controls_layout.addWidget(QLabel("Area of Interest:"), 0, 0)
         self.map_area_input = QLineEdit("Coordinate: 34.0522°N, 118.2437°W")
-        controls_layout.addWidget(self.map_area_input, 0, 1)
+        controls_layout.addRow("Area of Interest:", self.map_area_input)
         
-        controls_layout.addWidget(QLabel("Hazard Types:"), 1, 0)
         hazard_layout = QHBoxLayout()
         
         self.fire_hazard_cb = QCheckBox("Fire")
@@ -581,10 +1007,10 @@ class IoSTMainWindow(QMainWindow):
         self.toxic_hazard_cb = QCheckBox("Toxic Gas")
         hazard_layout.addWidget(self.toxic_hazard_cb)
         
-        controls_layout.addLayout(hazard_layout, 1, 1)
+        controls_layout.addRow("Hazard Types:", hazard_layout)
         
         self.generate_map_btn = QPushButton("🗺️ Generate Survival Map")
-        controls_layout.addWidget(self.generate_map_btn, 2, 0, 1, 2)
+        controls_layout.addRow(self.generate_map_btn)
         
         layout.addWidget(controls_group)
         
@@ -592,7 +1018,7 @@ class IoSTMainWindow(QMainWindow):
         map_group = QGroupBox("Hazard Map and Safe Routes")
         map_layout = QVBoxLayout(map_group)
         
-        self.survival_map_view = SurvivalMapWidget()
+        self.survival_map_view = SurvivalMapPlot() if PYQTGRAPH_AVAILABLE else SurvivalMapWidget()
         map_layout.addWidget(self.survival_map_view)
         
         layout.addWidget(map_group)
@@ -610,7 +1036,7 @@ class IoSTMainWindow(QMainWindow):
         
         self.network_health_score = QProgressBar()
         self.network_health_score.setValue(94)
-        self.network_health_score.setFormat("Network Health: 94%")
+        self.network_health_score.setFormat("Network Health: %p%")
         health_layout.addWidget(QLabel("Overall Health:"), 0, 0)
         health_layout.addWidget(self.network_health_score, 0, 1)
         
@@ -626,24 +1052,21 @@ class IoSTMainWindow(QMainWindow):
         healing_group = QGroupBox("Self-Healing Operations")
         healing_layout = QVBoxLayout(healing_group)
         
-        self.healing_log = QTextBrowser()
-        self.healing_log.setHtml("""
-        <h4>Recent Self-Healing Activities</h4>
-        <p><span style="color: green;">[14:23]</span> Node failure detected: SAT-042</p>
-        <p><span style="color: blue;">[14:24]</span> Automatic rerouting initiated</p>
-        <p><span style="color: green;">[14:25]</span> Network topology optimized</p>
-        <p><span style="color: blue;">[14:26]</span> Backup systems activated</p>
-        <p><span style="color: green;">[14:27]</span> Service restored - 0 data loss</p>
-        """)
+        self.healing_log, self._heal_cursor = _make_log_view([
+            "[14:23] Node failure detected: SAT-042",
+            "[14:24] Automatic rerouting initiated",
+            "[14:25] Network topology optimized",
+            "[14:26] Backup systems activated",
+            "[14:27] Service restored - 0 data loss",
+        ])
         healing_layout.addWidget(self.healing_log)
         
         layout.addWidget(healing_group)
         
         parent_tabs.addTab(tab, "🛡️ Resilience Monitor")
     
-    def create_telemetry_monitoring_tab(self):
+    def create_telemetry_monitoring_tab(self, tab):
         """Create telemetry monitoring tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Real-time telemetry display
@@ -654,15 +1077,13 @@ class IoSTMainWindow(QMainWindow):
         selection_layout = QHBoxLayout()
         selection_layout.addWidget(QLabel("Spacecraft:"))
         
-        self.telemetry_spacecraft_combo = QComboBox()
-        self.telemetry_spacecraft_combo.addItems([
+        self.telemetry_spacecraft_combo = _combo([
             "ISS", "Luna Gateway", "Crew Dragon", "Starship"
         ])
         selection_layout.addWidget(self.telemetry_spacecraft_combo)
         
         selection_layout.addWidget(QLabel("Parameters:"))
-        self.telemetry_params_combo = QComboBox()
-        self.telemetry_params_combo.addItems([
+        self.telemetry_params_combo = _combo([
             "Power Systems", "Thermal Management", "Attitude Control", "Life Support"
         ])
         selection_layout.addWidget(self.telemetry_params_combo)
@@ -677,12 +1098,9 @@ class IoSTMainWindow(QMainWindow):
         telemetry_layout.addWidget(self.telemetry_widget)
         
         layout.addWidget(telemetry_group)
-        
-        self.tab_widget.addTab(tab, "📊 Telemetry")
     
-    def create_emergency_response_tab(self):
+    def create_emergency_response_tab(self, tab):
         """Create emergency response tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Emergency status
@@ -691,7 +1109,7 @@ class IoSTMainWindow(QMainWindow):
         
         # Emergency alert
         alert_frame = QFrame()
-        alert_frame.setStyleSheet("background-color: #ff4444; color: white; padding: 10px; border-radius: 5px;")
+        alert_frame.setStyleSheet(_QSS_EMERGENCY_FRAME)
         alert_layout = QHBoxLayout(alert_frame)
         
         alert_layout.addWidget(QLabel("🚨 EMERGENCY STATUS: NO ACTIVE EMERGENCIES"))
@@ -730,7 +1148,7 @@ class IoSTMainWindow(QMainWindow):
         action_grid = QGridLayout()
         
         self.evac_btn = QPushButton("🚀 Emergency Evacuation")
-        self.evac_btn.setStyleSheet("background-color: #ff6600; color: white; font-weight: bold;")
+        self.evac_btn.setStyleSheet(_QSS_EVAC_BTN)
         action_grid.addWidget(self.evac_btn, 0, 0)
         
         self.override_btn = QPushButton("🔧 System Override")
@@ -748,16 +1166,11 @@ class IoSTMainWindow(QMainWindow):
         log_group = QGroupBox("Emergency Response Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.emergency_log = QTextBrowser()
-        self.emergency_log.setHtml("""
-        <h4>Emergency Response History</h4>
-        <p><span style="color: gray;">[2025-07-29 14:23]</span> 
-        Emergency drill completed successfully - All personnel accounted for</p>
-        <p><span style="color: gray;">[2025-07-28 09:15]</span> 
-        Minor thermal anomaly resolved - No crew action required</p>
-        <p><span style="color: gray;">[2025-07-27 16:45]</span> 
-        Communication blackout test - Backup systems activated</p>
-        """)
+        self.emergency_log, self._emergency_cursor = _make_log_view([
+            "[2025-07-29 14:23] Emergency drill completed successfully - All personnel accounted for",
+            "[2025-07-28 09:15] Minor thermal anomaly resolved - No crew action required",
+            "[2025-07-27 16:45] Communication blackout test - Backup systems activated",
+        ])
         log_layout.addWidget(self.emergency_log)
         
         actions_layout.addWidget(log_group)
@@ -766,36 +1179,30 @@ class IoSTMainWindow(QMainWindow):
         emergency_layout.addWidget(protocols_splitter)
         
         layout.addWidget(emergency_group)
-        
-        self.tab_widget.addTab(tab, "🚨 Emergency")
     
-    def create_system_diagnostics_tab(self):
+    def create_system_diagnostics_tab(self, tab):
         """Create system diagnostics tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # System overview
         overview_group = QGroupBox("System Diagnostics Overview")
-        overview_layout = QGridLayout(overview_group)
+        overview_layout = _form_layout(overview_group)
         
         # Performance metrics
         self.cpu_usage = QProgressBar()
         self.cpu_usage.setValue(23)
-        self.cpu_usage.setFormat("CPU: 23%")
-        overview_layout.addWidget(QLabel("CPU Usage:"), 0, 0)
-        overview_layout.addWidget(self.cpu_usage, 0, 1)
+        self.cpu_usage.setFormat("CPU: %p%")
+        overview_layout.addRow("CPU Usage:", self.cpu_usage)
         
         self.memory_usage = QProgressBar()
         self.memory_usage.setValue(67)
-        self.memory_usage.setFormat("Memory: 67%")
-        overview_layout.addWidget(QLabel("Memory Usage:"), 1, 0)
-        overview_layout.addWidget(self.memory_usage, 1, 1)
+        self.memory_usage.setFormat("Memory: %p%")
+        overview_layout.addRow("Memory Usage:", self.memory_usage)
         
         self.network_usage = QProgressBar()
         self.network_usage.setValue(45)
-        self.network_usage.setFormat("Network: 45%")
-        overview_layout.addWidget(QLabel("Network Usage:"), 2, 0)
-        overview_layout.addWidget(self.network_usage, 2, 1)
+        self.network_usage.setFormat("Network: %p%")
+        overview_layout.addRow("Network Usage:", self.network_usage)
         
         layout.addWidget(overview_group)
         
@@ -803,9 +1210,6 @@ class IoSTMainWindow(QMainWindow):
         components_group = QGroupBox("Component Status")
         components_layout = QVBoxLayout(components_group)
         
-        self.components_table = QTableWidget(8, 3)
-        self.components_table.setHorizontalHeaderLabels(["Component", "Status", "Last Check"])
-        
         components = [
             ("Mission Control Core", "🟢 Operational", "30 sec ago"),
             ("Satellite Manager", "🟢 Operational", "30 sec ago"),
@@ -817,76 +1221,41 @@ class IoSTMainWindow(QMainWindow):
             ("User Interface", "🟢 Operational", "Now")
         ]
         
-        for i, (component, status, check) in enumerate(components):
-            self.components_table.setItem(i, 0, QTableWidgetItem(component))
-            self.components_table.setItem(i, 1, QTableWidgetItem(status))
-            self.components_table.setItem(i, 2, QTableWidgetItem(check))
+        self.components_model = RowTableModel(components, ["Component", "Status", "Last Check"])
+        self.components_table = QTableView()
+        self.components_table.setModel(self.components_model)
         
         components_layout.addWidget(self.components_table)
         layout.addWidget(components_group)
-        
-        self.tab_widget.addTab(tab, "🔧 Diagnostics")
     
     def init_menus(self):
         """Initialize menu bar"""
         menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu('File')
-        
-        export_action = QAction('Export Report', self)
-        export_action.triggered.connect(self.export_report)
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction('Exit', self)
-        exit_action.setShortcut('Ctrl+Q')
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # View menu
-        view_menu = menubar.addMenu('View')
-        
-        fullscreen_action = QAction('Fullscreen', self)
-        fullscreen_action.setShortcut('F11')
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        view_menu.addAction(fullscreen_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu('Tools')
-        
-        settings_action = QAction('Settings', self)
-        settings_action.triggered.connect(self.open_settings)
-        tools_menu.addAction(settings_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu('Help')
-        
-        about_action = QAction('About IoST', self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        for title, items in _MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot = item
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
     
     def init_toolbar(self):
         """Initialize toolbar"""
         toolbar = self.addToolBar('Main')
-        
-        # Emergency button
-        emergency_action = QAction('🚨 Emergency', self)
-        emergency_action.triggered.connect(self.trigger_emergency)
-        toolbar.addAction(emergency_action)
-        
-        toolbar.addSeparator()
-        
-        # Refresh button
-        refresh_action = QAction('🔄 Refresh', self)
-        refresh_action.triggered.connect(self.refresh_all_data)
-        toolbar.addAction(refresh_action)
-        
-        # Screenshot button
-        screenshot_action = QAction('📸 Screenshot', self)
-        screenshot_action.triggered.connect(self.take_screenshot)
-        toolbar.addAction(screenshot_action)
+        toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        for item in _TOOLBAR_SPEC:
+            if item is None:
+                toolbar.addSeparator()
+                continue
+            text, icon, slot = item
+            action = QAction(_icon(icon), text, self)
+            action.triggered.connect(getattr(self, slot))
+            toolbar.addAction(action)
     
     def init_status_bar(self):
         """Initialize status bar"""
@@ -898,148 +1267,103 @@ class IoSTMainWindow(QMainWindow):
         self.status_bar.addPermanentWidget(self.connection_status)
         
         self.time_label = QLabel()
+        self._last_time_text = ""
         self.status_bar.addPermanentWidget(self.time_label)
     
     def init_timers(self):
-        """Initialize update timers"""
-        # Main update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_displays)
-        self.update_timer.start(1000)  # Update every second
-        
-        # Time display timer
-        self.time_timer = QTimer()
-        self.time_timer.timeout.connect(self.update_time)
-        self.time_timer.start(1000)
-    
-    def apply_space_theme(self):
-        """Apply space-themed styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a2e;
-                color: #ffffff;
-            }
-            
-            QTabWidget::pane {
-                border: 2px solid #3a3a5c;
-                background-color: #16213e;
-            }
-            
-            QTabBar::tab {
-                background-color: #0f3460;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin: 2px;
-                border-radius: 4px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #e94560;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #3a3a5c;
-                border-radius: 8px;
-                margin: 5px;
-                padding-top: 10px;
-                background-color: #16213e;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #ffffff;
-            }
-            
-            QPushButton {
-                background-color: #0f3460;
-                color: #ffffff;
-                border: 2px solid #3a3a5c;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #e94560;
-            }
-            
-            QPushButton:pressed {
-                background-color: #c73650;
-            }
-            
-            QProgressBar {
-                border: 2px solid #3a3a5c;
-                border-radius: 5px;
-                text-align: center;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #00ff88;
-                border-radius: 3px;
-            }
-            
-            QTableWidget {
-                background-color: #16213e;
-                color: #ffffff;
-                gridline-color: #3a3a5c;
-                border: 1px solid #3a3a5c;
-            }
-            
-            QHeaderView::section {
-                background-color: #0f3460;
-                color: #ffffff;
-                padding: 6px;
-                border: 1px solid #3a3a5c;
-                font-weight: bold;
-            }
-            
-            QListWidget {
-                background-color: #16213e;
-                color: #ffffff;
-                border: 1px solid #3a3a5c;
-            }
-            
-            QTextEdit, QTextBrowser {
-                background-color: #16213e;
-                color: #ffffff;
-                border: 1px solid #3a3a5c;
-            }
-            
-            QComboBox {
-                background-color: #0f3460;
-                color: #ffffff;
-                border: 1px solid #3a3a5c;
-                padding: 4px;
-            }
-            
-            QLineEdit {
-                background-color: #16213e;
-                color: #ffffff;
-                border: 1px solid #3a3a5c;
-                padding: 4px;
-            }
-            
-            QSpinBox, QDoubleSpinBox {
-                background-color: #16213e;
-                color: #ffffff;
-                border: 1px solid #3a3a5c;
-            }
-        """)
+        """Initialize the coalesced update timer"""
+        self._tick = QTimer(self)
+        self._tick.setInterval(1000)  # Update every second
+        self._tick.timeout.connect(self._flush_updates)
+        self._tick.start()
+    
+    def init_perf_probe(self):
+        """Start sampling CPU/memory/network usage on a background thread"""
+        # Most recent samples as (cpu, mem, net) tuples
+        self.perf_history = deque(maxlen=60)
+        self._perf_thread = None
+        if not PSUTIL_AVAILABLE:
+            return
+        
+        self._perf_probe = PerfProbe()
+        self._perf_thread = QThread(self)
+        self._perf_probe.moveToThread(self._perf_thread)
+        self._perf_thread.started.connect(self._perf_probe.run)
+        self._perf_probe.sample.connect(self._on_perf_sample)
+        self._perf_thread.start()
+    
+    def _on_perf_sample(self, cpu, mem, net):
+        """Record a probe sample and show it on the diagnostics bars"""
+        self.perf_history.append((cpu, mem, net))
+        self.update_perf(cpu, mem, net)
+    
+    def closeEvent(self, event):
+        """Stop the background probe before the window goes away"""
+        if self._perf_thread is not None:
+            self._perf_probe.stop()
+            self._perf_thread.quit()
+            self._perf_thread.wait()
+        super().closeEvent(event)
     
     def update_displays(self):
         """Update all display elements"""
         # This would update real-time data in a full implementation
         pass
     
+    def _flush_updates(self):
+        """Run the periodic display updates from the single 1 Hz tick"""
+        # Each widget schedules its own small update; Qt merges them
+        self.update_time()
+        self.update_displays()
+    
+    def set_system_status(self, state, text):
+        """Show a system status ("nominal", "warning" or "critical") with text"""
+        if not hasattr(self, "system_status_label"):
+            return
+        
+        self.system_status_icon.setPixmap(_glyph_pixmap(_STATUS_GLYPHS[state]))
+        if self.system_status_label.text() != text:
+            self.system_status_label.setText(text)
+    
+    def update_perf(self, cpu, mem, net):
+        """Update the diagnostics performance bars in a single repaint"""
+        if not hasattr(self, "cpu_usage"):
+            return
+        
+        bars = (self.cpu_usage, self.memory_usage, self.network_usage)
+        with QSignalBlocker(bars[0]), QSignalBlocker(bars[1]), QSignalBlocker(bars[2]):
+            for bar, value in zip(bars, (cpu, mem, net)):
+                bar.setValue(value)
+    
+    def refresh_predictions(self, rows):
+        """Replace the orbital inference predictions"""
+        if hasattr(self, "predictions_model"):
+            self.predictions_model.set_rows(rows)
+    
+    def refresh_components(self, rows):
+        """Replace the diagnostics component status rows"""
+        if hasattr(self, "components_model"):
+            self.components_model.set_rows(rows)
+    
+    def log_healing_event(self, line):
+        """Append a line to the self-healing log"""
+        if hasattr(self, "_heal_cursor"):
+            _append_log_line(self._heal_cursor, line)
+    
+    def log_emergency_event(self, line):
+        """Append a line to the emergency response log"""
+        if hasattr(self, "_emergency_cursor"):
+            _append_log_line(self._emergency_cursor, line)
+    
     def update_time(self):
         """Update time display"""
-        current_time = QDateTime.currentDateTime()
-        self.time_label.setText(current_time.toString("yyyy-MM-dd hh:mm:ss UTC"))
+        if not self.time_label.isVisible():
+            return
+        
+        text = time.strftime(self._TIME_FMT, time.gmtime())
+        if text != self._last_time_text:
+            self.time_label.setText(text)
+            self._last_time_text = text
     
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
@@ -1050,6 +1374,8 @@ class IoSTMainWindow(QMainWindow):
     
     def trigger_emergency(self):
         """Trigger emergency protocol"""
+        from PyQt6.QtWidgets import QMessageBox
+        
         reply = QMessageBox.question(
             self, 'Emergency Protocol',
             'Are you sure you want to trigger emergency protocols?',
@@ -1059,17 +1385,45 @@ class IoSTMainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.status_bar.showMessage("🚨 EMERGENCY PROTOCOL ACTIVATED", 5000)
     
+    def run_task(self, started_message, fn, done_message, timeout=2000):
+        """Run fn on the thread pool; only its status text returns to the GUI thread"""
+        self.status_bar.showMessage(started_message)
+        task = _Task(fn, done_message, timeout)
+        task.signals.status.connect(
+            self.status_bar.showMessage, Qt.ConnectionType.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(task)
+    
     def refresh_all_data(self):
         """Refresh all data displays"""
         self.status_bar.showMessage("Refreshing all data...", 2000)
     
     def take_screenshot(self):
         """Take screenshot of current view"""
-        self.status_bar.showMessage("Screenshot saved", 2000)
+        # Grabbing needs the GUI thread; encoding and writing the PNG does not
+        image = self.grab().toImage()
+        path = time.strftime("iost_screenshot_%Y%m%d_%H%M%S.png")
+        self.run_task(
+            "Saving screenshot...", lambda: _save_image(image, path),
+            f"Screenshot saved to {path}"
+        )
     
     def export_report(self):
         """Export system report"""
-        self.status_bar.showMessage("Report exported successfully", 2000)
+        # Snapshot widget state on the GUI thread; formatting and writing does not need it
+        lines = [
+            f"IoST System Report - {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"System status: {self.system_status_label.text()}",
+            f"Failed systems: {', '.join(sorted(self._failed_systems)) or 'none'}",
+        ]
+        if self.perf_history:
+            cpu, mem, net = self.perf_history[-1]
+            lines.append(f"CPU: {cpu}%  Memory: {mem}%  Network: {net}%")
+        path = time.strftime("iost_report_%Y%m%d_%H%M%S.txt")
+        self.run_task(
+            "Exporting report...", lambda: _write_report(lines, path),
+            f"Report exported to {path}"
+        )
     
     def open_settings(self):
         """Open settings dialog"""
@@ -1077,6 +1431,8 @@ class IoSTMainWindow(QMainWindow):
     
     def show_about(self):
         """Show about dialog"""
+        from PyQt6.QtWidgets import QMessageBox
+        
         QMessageBox.about(
             self, 'About IoST',
             'Internet of Space Things (IoST)\n'
@@ -1086,30 +1442,136 @@ class IoSTMainWindow(QMainWindow):
         )
 
 
+class RowTableModel(QAbstractTableModel):
+    """Read-only table model backed by a list of row tuples
+    
+    Rows are held by reference, not copied; callers hand over ownership.
+    """
+    
+    def __init__(self, rows, headers, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._headers = headers
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+    
+    def set_rows(self, rows):
+        """Replace all rows, emitting a single change notification"""
+        # Rows are held by reference, so the same list may come back resized
+        if rows is self._rows or len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        # Same shape: keep the view's items and repaint the cells in place
+        self._rows = rows
+        if rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(rows) - 1, len(self._headers) - 1),
+                [Qt.ItemDataRole.DisplayRole],
+            )
+
+
 class SpacecraftMapWidget(QWidget):
     """Widget for displaying real-time spacecraft positions"""
     
     def __init__(self):
         super().__init__()
         self.setMinimumSize(600, 400)
-        self.spacecraft_positions = [
-            {"name": "ISS", "x": 150, "y": 100, "status": "operational"},
-            {"name": "Luna Gateway", "x": 400, "y": 200, "status": "operational"},
-            {"name": "Crew Dragon", "x": 200, "y": 150, "status": "operational"},
-            {"name": "CubeSat-1", "x": 300, "y": 80, "status": "operational"},
-            {"name": "CubeSat-2", "x": 500, "y": 120, "status": "warning"}
-        ]
+        _set_opaque_painting(self)
+        self.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        
+        # Paint primitives, built once and reused every frame
+        self._orbit_pen = QPen(_ORBIT, 2)
+        self._earth_brush = QBrush(_EARTH)
+        self._earth_pen = QPen(_WHITE, 2)
+        self._label_pen = QPen(_WHITE)
+        
+        # Markers are round-capped points: a white outline under a status fill
+        self._outline_pen = _round_pen(_WHITE, 12)
+        self._op_pen = _round_pen(_GREEN, 10)
+        self._warn_pen = _round_pen(_YELLOW, 10)
+        self._marker_points = None
+        
+        # drawStaticText positions by top-left, drawText by baseline
+        self._label_ascent = QFontMetrics(self.font()).ascent()
+        
+        # Background, orbits and Earth; rebuilt only when the size changes
+        self._bg_cache = None
+        
+        names, xs, ys, statuses = zip(*_DEMO_SPACECRAFT)
+        self.set_spacecraft(names, xs, ys, statuses)
     
-    def paintEvent(self, event):
-        """Paint the spacecraft map"""
-        painter = QPainter(self)
+    def set_spacecraft(self, names, xs, ys, statuses):
+        """Replace all spacecraft markers and labels"""
+        # Spacecraft as parallel typed arrays (1 = operational, 0 = warning)
+        self._names = list(names)
+        self._xs = array("i", (int(x) for x in xs))
+        self._ys = array("i", (int(y) for y in ys))
+        self._status = array("B", (status == "operational" for status in statuses))
+        
+        # Labels are shaped once per name set
+        self._labels = [_static_label(name, self.font()) for name in self._names]
+        self._label_rects = [self._label_rect(i) for i in range(len(self._names))]
+        self._marker_points = None
+        self.update()
+    
+    def resizeEvent(self, event):
+        """Invalidate the static background cache"""
+        self._bg_cache = None
+        super().resizeEvent(event)
+        # The map is centred, so static contents do not survive a resize
+        self.update()
+    
+    def _label_rect(self, index):
+        """Rect a spacecraft's name label occupies, beside its marker"""
+        top_left = QPointF(self._xs[index] + 10, self._ys[index] + 5 - self._label_ascent)
+        return QRectF(top_left, self._labels[index].size())
+    
+    def _marker_rect(self, index):
+        """Bounding rect of a spacecraft's marker and label"""
+        x, y = self._xs[index], self._ys[index]
+        label_rect = self._label_rects[index].toAlignedRect().adjusted(-1, -1, 1, 1)
+        return QRect(x - 7, y - 7, 14, 14).united(label_rect)
+    
+    def move_spacecraft(self, index, x, y):
+        """Move one spacecraft, repainting only the area it left and entered"""
+        old_rect = self._marker_rect(index)
+        self._xs[index] = x
+        self._ys[index] = y
+        self._label_rects[index] = self._label_rect(index)
+        self._marker_points = None
+        self.update(old_rect.united(self._marker_rect(index)))
+    
+    def _render_background(self):
+        """Render the space background, orbital paths and Earth into a pixmap"""
+        pixmap = QPixmap(self.size())
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw space background
-        painter.fillRect(self.rect(), QColor(10, 10, 30))
+        painter.fillRect(pixmap.rect(), _SPACE_BG)
         
         # Draw orbital paths
-        painter.setPen(QPen(QColor(100, 100, 150), 2))
+        painter.setPen(self._orbit_pen)
         for i in range(3):
             radius = 100 + i * 80
             painter.drawEllipse(
@@ -1120,8 +1582,8 @@ class SpacecraftMapWidget(QWidget):
             )
         
         # Draw Earth
-        painter.setBrush(QBrush(QColor(100, 150, 255)))
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
+        painter.setBrush(self._earth_brush)
+        painter.setPen(self._earth_pen)
         earth_radius = 50
         painter.drawEllipse(
             self.width() // 2 - earth_radius,
@@ -1129,19 +1591,43 @@ class SpacecraftMapWidget(QWidget):
             earth_radius * 2,
             earth_radius * 2
         )
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the spacecraft map"""
+        if self._bg_cache is None:
+            self._bg_cache = self._render_background()
         
-        # Draw spacecraft
-        for spacecraft in self.spacecraft_positions:
-            color = QColor(0, 255, 0) if spacecraft["status"] == "operational" else QColor(255, 255, 0)
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            
-            x, y = spacecraft["x"], spacecraft["y"]
-            painter.drawEllipse(x - 5, y - 5, 10, 10)
-            
-            # Draw spacecraft name
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            painter.drawText(x + 10, y + 5, spacecraft["name"])
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw spacecraft markers, one draw call per status group
+        if self._marker_points is None:
+            self._marker_points = self._build_marker_points()
+        all_points, op_points, warn_points = self._marker_points
+        painter.setPen(self._outline_pen)
+        painter.drawPoints(all_points)
+        painter.setPen(self._op_pen)
+        painter.drawPoints(op_points)
+        painter.setPen(self._warn_pen)
+        painter.drawPoints(warn_points)
+        
+        # Draw spacecraft names
+        painter.setPen(self._label_pen)
+        painter.setFont(self.font())
+        region = event.region()
+        for rect, label in zip(self._label_rects, self._labels):
+            if region.intersects(rect.toAlignedRect()):
+                painter.drawStaticText(rect.topLeft(), label)
+    
+    def _build_marker_points(self):
+        """Group marker centres into all/operational/warning point polygons"""
+        points = [QPoint(x, y) for x, y in zip(self._xs, self._ys)]
+        op_points = [p for p, ok in zip(points, self._status) if ok]
+        warn_points = [p for p, ok in zip(points, self._status) if not ok]
+        return QPolygon(points), QPolygon(op_points), QPolygon(warn_points)
 
 
 class SatelliteStatusWidget(QWidget):
@@ -1164,7 +1650,7 @@ class SatelliteStatusWidget(QWidget):
         
         info_layout.addWidget(QLabel("Status:"), 1, 0)
         status_label = QLabel("🟢 Operational")
-        status_label.setStyleSheet("color: green; font-weight: bold;")
+        status_label.setStyleSheet(_QSS_STATUS_OK_BOLD)
         info_layout.addWidget(status_label, 1, 1)
         
         info_layout.addWidget(QLabel("Position:"), 2, 0)
@@ -1192,19 +1678,19 @@ class SatelliteStatusWidget(QWidget):
         # Thermal system
         systems_layout.addWidget(QLabel("Thermal:"), 1, 0)
         thermal_label = QLabel("🟢 22.3°C")
-        thermal_label.setStyleSheet("color: green;")
+        thermal_label.setStyleSheet(_QSS_STATUS_OK)
         systems_layout.addWidget(thermal_label, 1, 1)
         
         # Attitude system
         systems_layout.addWidget(QLabel("Attitude:"), 2, 0)
         attitude_label = QLabel("🟢 Stable")
-        attitude_label.setStyleSheet("color: green;")
+        attitude_label.setStyleSheet(_QSS_STATUS_OK)
         systems_layout.addWidget(attitude_label, 2, 1)
         
         # Communications
         systems_layout.addWidget(QLabel("Comms:"), 3, 0)
         comms_label = QLabel("🟢 Strong")
-        comms_label.setStyleSheet("color: green;")
+        comms_label.setStyleSheet(_QSS_STATUS_OK)
         systems_layout.addWidget(comms_label, 3, 1)
         
         layout.addWidget(systems_group)
@@ -1216,38 +1702,208 @@ class SurvivalMapWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setMinimumSize(500, 400)
+        _set_opaque_painting(self)
+        
+        # The map is static; it is rendered once per size and blitted
+        self._cache = None
+        self._hazard_image = None
+        ascent = QFontMetrics(self.font()).ascent()
+        self._labels = [
+            (x, y - ascent, _static_label(text, self.font()))
+            for x, y, text in _DEMO_MAP_LABELS
+        ]
+    
+    def resizeEvent(self, event):
+        """Invalidate the rendered map"""
+        self._cache = None
+        super().resizeEvent(event)
+    
+    def set_hazard_map(self, grid):
+        """Display a (rows, cols) grid of hazard levels in place of the demo zones"""
+        lut = np.array(
+            [0xFF000000 | r << 16 | g << 8 | b for r, g, b in _HAZARD_LUT], dtype=np.uint32
+        )
+        image = np.ascontiguousarray(lut[grid])
+        height, width = image.shape
+        # copy() detaches the QImage from the numpy buffer before it is freed
+        self._hazard_image = QImage(
+            image.data, width, height, width * 4, QImage.Format.Format_ARGB32
+        ).copy()
+        self._cache = None
+        self.update()
     
     def paintEvent(self, event):
         """Paint the survival map"""
+        if self._cache is None or self._cache.size() != self.size():
+            self._cache = QPixmap(self.size())
+            cache_painter = QPainter(self._cache)
+            self._render_into(cache_painter)
+            cache_painter.end()
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+    
+    def _render_into(self, painter):
+        """Draw the hazard zones, safe zones, route and labels"""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw map background
-        painter.fillRect(self.rect(), QColor(240, 240, 240))
+        painter.fillRect(self.rect(), _MAP_BG)
         
-        # Draw hazard zones (red areas)
-        painter.setBrush(QBrush(QColor(255, 100, 100, 128)))
-        painter.setPen(QPen(QColor(255, 0, 0), 2))
-        painter.drawEllipse(50, 50, 100, 100)
-        painter.drawEllipse(300, 200, 80, 80)
-        
-        # Draw safe zones (green areas)
-        painter.setBrush(QBrush(QColor(100, 255, 100, 128)))
-        painter.setPen(QPen(QColor(0, 255, 0), 2))
-        painter.drawEllipse(400, 50, 120, 120)
-        painter.drawEllipse(100, 300, 100, 100)
+        if self._hazard_image is not None:
+            painter.drawImage(0, 0, self._hazard_image)
+        else:
+            # Draw hazard zones (red areas)
+            painter.setBrush(QBrush(_HAZARD_FILL))
+            painter.setPen(QPen(_HAZARD_EDGE, 2))
+            for x, y, diameter in _DEMO_HAZARD_ZONES:
+                painter.drawEllipse(x, y, diameter, diameter)
+            
+            # Draw safe zones (green areas)
+            painter.setBrush(QBrush(_SAFE_FILL))
+            painter.setPen(QPen(_SAFE_EDGE, 2))
+            for x, y, diameter in _DEMO_SAFE_ZONES:
+                painter.drawEllipse(x, y, diameter, diameter)
         
         # Draw safe route (blue line)
-        painter.setPen(QPen(QColor(0, 100, 255), 4))
-        painter.drawLine(20, 20, 450, 100)
-        painter.drawLine(450, 100, 150, 350)
+        painter.setPen(QPen(_ROUTE, 4))
+        for (x1, y1), (x2, y2) in zip(_DEMO_SAFE_ROUTE, _DEMO_SAFE_ROUTE[1:]):
+            painter.drawLine(x1, y1, x2, y2)
         
         # Draw labels
-        painter.setPen(QPen(QColor(0, 0, 0)))
-        painter.drawText(70, 105, "Fire Zone")
-        painter.drawText(320, 245, "Flood Risk")
-        painter.drawText(430, 115, "Safe Zone")
-        painter.drawText(125, 355, "Shelter")
+        painter.setPen(QPen(_BLACK))
+        painter.setFont(self.font())
+        for x, top, label in self._labels:
+            painter.drawStaticText(x, top, label)
+
+
+class SpacecraftMapPlot(QWidget):
+    """pyqtgraph spacecraft map; positions are pushed as numpy arrays"""
+    
+    def __init__(self):
+        super().__init__()
+        self.setMinimumSize(600, 400)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setBackground((10, 10, 30))
+        layout.addWidget(self.graphics)
+        
+        self.plot = _static_plot(self.graphics, 600, 400)
+        
+        # Static orbital paths and Earth around the map centre
+        theta = np.linspace(0, 2 * np.pi, 181)
+        orbit_pen = pg.mkPen((100, 100, 150), width=2)
+        for i in range(3):
+            radius = 100 + i * 80
+            self.plot.addItem(pg.PlotCurveItem(
+                300 + radius * np.cos(theta), 200 + radius * np.sin(theta),
+                pen=orbit_pen, antialias=False
+            ))
+        self.plot.addItem(pg.ScatterPlotItem(
+            [300], [200], size=100, pxMode=False, antialias=False,
+            pen=pg.mkPen((255, 255, 255), width=2), brush=pg.mkBrush(100, 150, 255)
+        ))
+        
+        self._brushes = {
+            "operational": pg.mkBrush(0, 255, 0),
+            "warning": pg.mkBrush(255, 255, 0),
+        }
+        self.scatter = pg.ScatterPlotItem(
+            size=10, antialias=False, pen=pg.mkPen((255, 255, 255), width=1)
+        )
+        self.plot.addItem(self.scatter)
+        self._labels = []
+        
+        names, xs, ys, statuses = zip(*_DEMO_SPACECRAFT)
+        self.set_spacecraft(names, xs, ys, statuses)
+    
+    def set_spacecraft(self, names, xs, ys, statuses):
+        """Replace all spacecraft markers with a single setData call"""
+        # Own copies, so move_spacecraft never writes into the caller's arrays
+        self._xs = xs = np.array(xs, dtype=float)
+        self._ys = ys = np.array(ys, dtype=float)
+        warning = self._brushes["warning"]
+        self._marker_brushes = [self._brushes.get(status, warning) for status in statuses]
+        self.scatter.setData(x=xs, y=ys, brush=self._marker_brushes)
+        
+        if [label.toPlainText() for label in self._labels] != list(names):
+            for label in self._labels:
+                self.plot.removeItem(label)
+            self._labels = [pg.TextItem(name, color=(255, 255, 255), anchor=(0, 0.5)) for name in names]
+            for label in self._labels:
+                self.plot.addItem(label)
+        for label, x, y in zip(self._labels, xs, ys):
+            label.setPos(x + 10, y)
+    
+    def move_spacecraft(self, index, x, y):
+        """Move one spacecraft marker and its label"""
+        self._xs[index] = x
+        self._ys[index] = y
+        self.scatter.setData(x=self._xs, y=self._ys, brush=self._marker_brushes)
+        self._labels[index].setPos(x + 10, y)
+
+
+class SurvivalMapPlot(QWidget):
+    """pyqtgraph survival map; hazards are rendered as a single LUT image"""
+    
+    HAZARD_LUT = _HAZARD_LUT
+    
+    def __init__(self):
+        super().__init__()
+        self.setMinimumSize(500, 400)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setBackground(self.HAZARD_LUT[0])
+        layout.addWidget(self.graphics)
+        
+        self.plot = _static_plot(self.graphics, 500, 400)
+        
+        self.image = pg.ImageItem(axisOrder='row-major')
+        self.image.setLookupTable(np.array(self.HAZARD_LUT, dtype=np.uint8))
+        self.plot.addItem(self.image)
+        
+        route_x, route_y = np.asarray(_DEMO_SAFE_ROUTE, dtype=float).T
+        self.plot.addItem(pg.PlotCurveItem(
+            route_x, route_y, pen=pg.mkPen((0, 100, 255), width=4), antialias=False
+        ))
+        for x, y, text in _DEMO_MAP_LABELS:
+            label = pg.TextItem(text, color=(0, 0, 0), anchor=(0, 1))
+            label.setPos(x, y)
+            self.plot.addItem(label)
+        
+        self.set_hazard_map(self._demo_hazard_grid(400, 500))
+    
+    @staticmethod
+    def _demo_hazard_grid(height, width):
+        """Rasterize the demo safe/hazard circles into a level grid"""
+        yy, xx = np.mgrid[0:height, 0:width]
+        grid = np.zeros((height, width), dtype=np.uint8)
+        for level, zones in ((1, _DEMO_SAFE_ZONES), (2, _DEMO_HAZARD_ZONES)):
+            for x, y, diameter in zones:
+                radius = diameter / 2
+                grid[(xx - x - radius) ** 2 + (yy - y - radius) ** 2 <= radius ** 2] = level
+        return grid
+    
+    def set_hazard_map(self, grid):
+        """Display a (rows, cols) grid of hazard levels"""
+        self.image.setImage(grid, autoLevels=False, levels=(0, len(self.HAZARD_LUT) - 1))
+
+
+def _static_plot(graphics, width, height):
+    """Add a non-interactive, axis-free plot mapped to widget-style pixel coordinates"""
+    plot = graphics.addPlot()
+    plot.hideAxis('left')
+    plot.hideAxis('bottom')
+    plot.setMouseEnabled(x=False, y=False)
+    plot.hideButtons()
+    plot.invertY(True)
+    plot.setAspectLocked(True)
+    plot.setRange(xRange=(0, width), yRange=(0, height), padding=0)
+    return plot
 
 
 class TelemetryWidget(QWidget):
@@ -1287,42 +1943,153 @@ class TelemetryWidget(QWidget):
 class TelemetryChart(QWidget):
     """Individual telemetry chart widget"""
     
+    TRACE_TOP = 60
+    TRACE_MARGIN = 10
+    X_STEP = 8
+    
     def __init__(self, title, unit, value):
         super().__init__()
         self.title = title
         self.unit = unit
         self.value = value
+        self._value_text = f"{value} {unit}"
         self.setMinimumSize(200, 150)
+        _set_opaque_painting(self)
+        
+        # Fixed vertical scale around the nominal value
+        span = max(abs(value) * 0.1, 1.0)
+        self.y_min = value - span
+        self.y_max = value + span
+        
+        # Demo history: a gentle upward trend ending at the current value
+        self.samples = [value - span * 0.1 * (4 - i) for i in range(5)]
+        
+        # Background and trend line; new samples only draw their own segment
+        self._backing = QPixmap()
+        self._last_point = None
+        self._trend_pen = QPen(_TREND, 2)
+        self._title_pen = QPen(_WHITE)
+        self._value_font = QFont("Arial", 16, QFont.Weight.Bold)
+    
+    def _sample_point(self, index, value):
+        """Map a sample index/value to widget coordinates"""
+        top = self.TRACE_TOP
+        bottom = self.height() - self.TRACE_MARGIN
+        fraction = (value - self.y_min) / (self.y_max - self.y_min)
+        fraction = min(max(fraction, 0.0), 1.0)
+        return QPoint(
+            self.TRACE_MARGIN + index * self.X_STEP,
+            round(bottom - fraction * (bottom - top))
+        )
+    
+    def _capacity(self):
+        """Number of samples that fit across the trace area"""
+        return max((self.width() - 2 * self.TRACE_MARGIN) // self.X_STEP + 1, 2)
+    
+    def _redraw_backing(self):
+        """Repaint the background and the full trend line into the backing pixmap"""
+        self._backing.fill(_CHART_BG)
+        
+        painter = QPainter(self._backing)
+        if NUMPY_AVAILABLE and len(self.samples) > 1:
+            trace = self._rasterize_trace()
+            painter.drawImage(0, self.TRACE_TOP - 1, trace)
+        else:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(self._trend_pen)
+            painter.drawPolyline(QPolygon(
+                [self._sample_point(i, v) for i, v in enumerate(self.samples)]
+            ))
+        painter.end()
+        
+        if self.samples:
+            self._last_point = self._sample_point(len(self.samples) - 1, self.samples[-1])
+        else:
+            self._last_point = None
+    
+    def _rasterize_trace(self):
+        """Rasterize the trend line into an ARGB32 image with numpy, no per-point draws"""
+        width = self.width()
+        top = self.TRACE_TOP - 1
+        bottom = self.height() - self.TRACE_MARGIN + 1
+        height = max(bottom - top, 1)
+        
+        samples = np.asarray(self.samples, dtype=np.float32)
+        fraction = np.clip((samples - self.y_min) / (self.y_max - self.y_min), 0.0, 1.0)
+        sample_x = self.TRACE_MARGIN + np.arange(len(samples)) * self.X_STEP
+        sample_y = (height - 1) - fraction * (height - 2)
+        
+        # Interpolate a row per pixel column and fill the span to the next column
+        columns = np.arange(sample_x[0], min(sample_x[-1], width - 1) + 1)
+        rows = np.interp(columns, sample_x, sample_y)
+        next_rows = np.append(rows[1:], rows[-1])
+        low = np.floor(np.minimum(rows, next_rows)).astype(np.int32)[np.newaxis, :]
+        high = np.ceil(np.maximum(rows, next_rows)).astype(np.int32)[np.newaxis, :] + 1
+        grid = np.arange(height, dtype=np.int32)[:, np.newaxis]
+        
+        image = np.full((height, width), 0xFF16213E, dtype=np.uint32)
+        image[:, columns] = np.where((grid >= low) & (grid <= high), 0xFF00FF88, 0xFF16213E)
+        
+        # copy() detaches the QImage from the numpy buffer before it is freed
+        return QImage(image.data, width, height, width * 4, QImage.Format.Format_ARGB32).copy()
+    
+    def resizeEvent(self, event):
+        """Recreate the backing store at the new size"""
+        self._backing = QPixmap(self.size())
+        self.samples = self.samples[-self._capacity():]
+        self._redraw_backing()
+        super().resizeEvent(event)
+    
+    def setValue(self, value):
+        """Set the displayed value, repainting the header only when it changes"""
+        if value == self.value:
+            return
+        self.value = value
+        self._value_text = f"{value} {self.unit}"
+        self.update(0, 0, self.width(), self.TRACE_TOP)
+    
+    def add_sample(self, value):
+        """Append a sample, drawing only the new segment onto the backing store"""
+        self.setValue(value)
+        self.samples.append(value)
+        
+        if self._backing.isNull():
+            return
+        
+        if len(self.samples) > self._capacity():
+            # Trace reached the right edge: keep the newest half and redraw
+            self.samples = self.samples[-(self._capacity() // 2):]
+            self._redraw_backing()
+            self.update()
+            return
+        
+        point = self._sample_point(len(self.samples) - 1, value)
+        if self._last_point is not None:
+            painter = QPainter(self._backing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(self._trend_pen)
+            painter.drawLine(self._last_point, point)
+            painter.end()
+            self.update(QRect(self._last_point, point).normalized().adjusted(-2, -2, 2, 2))
+        self._last_point = point
     
     def paintEvent(self, event):
         """Paint the telemetry chart"""
         painter = QPainter(self)
+        if self._backing.isNull():
+            # Opaque painting: nothing under us to show before the first resize
+            painter.fillRect(self.rect(), _CHART_BG)
+        else:
+            painter.drawPixmap(0, 0, self._backing)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw background
-        painter.fillRect(self.rect(), QColor(22, 33, 62))
-        
         # Draw title
-        painter.setPen(QPen(QColor(255, 255, 255)))
+        painter.setPen(self._title_pen)
         painter.drawText(10, 20, self.title)
         
         # Draw value
-        painter.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        value_text = f"{self.value} {self.unit}"
-        painter.drawText(10, 50, value_text)
-        
-        # Draw simple trend line
-        painter.setPen(QPen(QColor(0, 255, 136), 2))
-        points = [
-            QPoint(10, 100),
-            QPoint(50, 95),
-            QPoint(90, 90),
-            QPoint(130, 85),
-            QPoint(170, 80)
-        ]
-        
-        for i in range(len(points) - 1):
-            painter.drawLine(points[i], points[i + 1])
+        painter.setFont(self._value_font)
+        painter.drawText(10, 50, self._value_text)
 
 
 def main():
@@ -1330,6 +2097,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Internet of Space Things")
     app.setApplicationVersion("1.0")
+    app.setStyleSheet(_SPACE_QSS)
     
     # Set application icon (if available)
     # app.setWindowIcon(QIcon("icon.png"))
@@ -4,11 +4,13 @@
 Real-time 3D spacecraft tracking and orbital visualization
 """
 
+import ctypes
 import math
+from functools import lru_cache
 
 import numpy as np
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QMatrix4x4, QQuaternion, QVector3D
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QMatrix4x4, QQuaternion, QVector3D
 from PyQt6.QtOpenGL import QOpenGLBuffer, QOpenGLShaderProgram, QOpenGLVertexArrayObject
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6.QtWidgets import (
@@ -31,7 +33,57 @@ try:
 except ImportError:
     OPENGL_AVAILABLE = False
 
+# Optional JIT compilation for the orbital mechanics helpers
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Pass-through stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
 from data_provider import data_provider
+from geometry import (
+    VERTEX_DTYPE,
+    cube_indices,
+    cube_vertices,
+    grid_vertices,
+    sphere_indices,
+    sphere_vertices,
+)
+
+
+# Column-major identity, the default model matrix uniform
+_IDENTITY_MATRIX = np.identity(4, dtype=np.float32).reshape(-1)
+
+
+class _StateSignals(QObject):
+    """Signals emitted by background spacecraft state fetches"""
+    
+    done = pyqtSignal(str, object)
+
+
+class _StateFetch(QRunnable):
+    """Fetch one spacecraft's state from the data provider on a worker thread"""
+    
+    def __init__(self, spacecraft_id):
+        super().__init__()
+        self.spacecraft_id = spacecraft_id
+        self.signals = _StateSignals()
+    
+    def run(self):
+        # Always report back so the widget can clear its pending flag
+        try:
+            state = data_provider.get_spacecraft_state(self.spacecraft_id)
+        except Exception as e:
+            print(f"Spacecraft state fetch failed for {self.spacecraft_id}: {e}")
+            state = None
+        self.signals.done.emit(self.spacecraft_id, state)
 
 
 class Spacecraft3DVisualizationWidget(QWidget):
@@ -43,6 +95,14 @@ class Spacecraft3DVisualizationWidget(QWidget):
         super().__init__()
         self.current_spacecraft = "ISS"
         self.tracking_enabled = True
+        self._fetch_pending = False
+        
+        # Bound label formatters, looked up once instead of per tick
+        self._altitude_fmt = "Altitude: {:.1f} km".format
+        self._velocity_fmt = "Velocity: {:.2f} km/s".format
+        self._period_fmt = "Period: {:.1f} min".format
+        self._inclination_fmt = "Inclination: {:.1f}°".format
+        
         self.init_ui()
         self.init_timers()
     
@@ -58,8 +118,11 @@ class Spacecraft3DVisualizationWidget(QWidget):
         spacecraft_layout = QHBoxLayout()
         spacecraft_layout.addWidget(QLabel("Spacecraft:"))
         
+        spacecraft_model = data_provider.spacecraft_list_model
+        data_provider.prefetch(spacecraft_model.stringList())
+        
         self.spacecraft_combo = QComboBox()
-        self.spacecraft_combo.addItems(data_provider.get_spacecraft_list())
+        self.spacecraft_combo.setModel(spacecraft_model)
         self.spacecraft_combo.currentTextChanged.connect(self.on_spacecraft_changed)
         spacecraft_layout.addWidget(self.spacecraft_combo)
         
@@ -106,6 +169,10 @@ class Spacecraft3DVisualizationWidget(QWidget):
         self.show_grid_checkbox.setChecked(False)
         display_options_layout.addWidget(self.show_grid_checkbox)
         
+        for checkbox in (self.show_orbit_checkbox, self.show_earth_checkbox,
+                         self.show_grid_checkbox):
+            checkbox.toggled.connect(self.on_display_options_changed)
+        
         controls_layout.addLayout(display_options_layout)
         
         layout.addWidget(controls_group)
@@ -136,9 +203,31 @@ class Spacecraft3DVisualizationWidget(QWidget):
     
     def init_timers(self):
         """Initialize update timers"""
-        self.update_timer = QTimer()
+        # Started by showEvent; 1 s while the application is active, 5 s otherwise
+        self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_visualization)
-        self.update_timer.start(1000)  # Update every second
+        
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._schedule_updates)
+    
+    def _schedule_updates(self, *args):
+        """Run the update timer at a rate matching visibility and app state"""
+        if not self.isVisible():
+            self.update_timer.stop()
+            return
+        active = QGuiApplication.applicationState() == Qt.ApplicationState.ApplicationActive
+        self.update_timer.start(1000 if active else 5000)
+    
+    def showEvent(self, event):
+        """Resume updates when the widget becomes visible"""
+        super().showEvent(event)
+        self._schedule_updates()
+    
+    def hideEvent(self, event):
+        """Stop updates while the widget is hidden"""
+        super().hideEvent(event)
+        self.update_timer.stop()
     
     def on_spacecraft_changed(self, spacecraft_id):
         """Handle spacecraft selection change"""
@@ -151,6 +240,14 @@ class Spacecraft3DVisualizationWidget(QWidget):
         self.tracking_enabled = enabled
         self.viewport_3d.set_tracking(enabled)
     
+    def on_display_options_changed(self):
+        """Push the display option checkboxes to the viewport"""
+        self.viewport_3d.set_display_options(
+            self.show_earth_checkbox.isChecked(),
+            self.show_orbit_checkbox.isChecked(),
+            self.show_grid_checkbox.isChecked()
+        )
+    
     def on_zoom_changed(self, value):
         """Handle zoom change"""
         zoom_factor = value / 50.0  # Normalize to 0.02 - 2.0
@@ -162,29 +259,36 @@ class Spacecraft3DVisualizationWidget(QWidget):
         self.zoom_slider.setValue(50)
     
     def update_visualization(self):
-        """Update 3D visualization and orbital data"""
-        spacecraft_data = data_provider.get_spacecraft_data(self.current_spacecraft)
-        
-        # Update orbital information display
-        position = spacecraft_data.get("position", {})
-        velocity = spacecraft_data.get("velocity", {})
-        orbital_data = spacecraft_data.get("orbital_data", {})
+        """Request fresh orbital data without blocking the GUI thread"""
+        if self._fetch_pending or not self.isVisible():
+            return
+        self._fetch_pending = True
         
-        altitude = position.get("altitude", 0)
-        self.altitude_label.setText(f"Altitude: {altitude:.1f} km")
+        fetch = _StateFetch(self.current_spacecraft)
+        fetch.signals.done.connect(self._apply_spacecraft_data)
+        QThreadPool.globalInstance().start(fetch)
+    
+    def _apply_spacecraft_data(self, spacecraft_id, state):
+        """Update the labels and viewport from a fetched state record"""
+        self._fetch_pending = False
+        if state is None:
+            return  # fetch failed; the next tick retries
+        if spacecraft_id != self.current_spacecraft:
+            return  # selection changed while the fetch was running
         
-        speed = (velocity.get("x", 0)**2 + velocity.get("y", 0)**2 + 
-                velocity.get("z", 0)**2)**0.5
-        self.velocity_label.setText(f"Velocity: {speed:.2f} km/s")
+        # Update orbital information display
+        self.altitude_label.setText(self._altitude_fmt(state["alt"]))
         
-        period = orbital_data.get("period", 0)
-        self.orbital_period_label.setText(f"Period: {period:.1f} min")
+        # Scalar sqrt beats np.linalg.norm's dispatch for a single 3-vector
+        vx, vy, vz = state["vel"].tolist()
+        speed = math.sqrt(vx * vx + vy * vy + vz * vz)
+        self.velocity_label.setText(self._velocity_fmt(speed))
         
-        inclination = orbital_data.get("inclination", 0)
-        self.inclination_label.setText(f"Inclination: {inclination:.1f}°")
+        self.orbital_period_label.setText(self._period_fmt(state["period"]))
+        self.inclination_label.setText(self._inclination_fmt(state["incl"]))
         
         # Update 3D viewport
-        self.viewport_3d.update_spacecraft_data(spacecraft_data)
+        self.viewport_3d.update_spacecraft_data(state)
 
 
 class OpenGL3DViewport(QOpenGLWidget):
@@ -200,9 +304,16 @@ class OpenGL3DViewport(QOpenGLWidget):
         self.mouse_last_pos = None
         
         # Spacecraft data
-        self.spacecraft_position = [0, 0, 400]  # km from Earth center
-        self.spacecraft_velocity = [0, 0, 0]
-        self.orbital_trail = []
+        self.spacecraft_position = np.array([0, 0, 400], dtype=np.float32)  # km
+        self.spacecraft_velocity = np.zeros(3, dtype=np.float32)
+        
+        # Orbital trail ring buffer; the extra slot mirrors slot 0 so the
+        # wrapped trail can be drawn as two contiguous line strips
+        self.trail_capacity = 100
+        self.orbital_trail = np.zeros((self.trail_capacity + 1, 3), dtype=np.float32)
+        self.trail_head = 0
+        self.trail_count = 0
+        self.trail_vbo = None
         
         # Earth parameters
         self.earth_radius = 6371  # km
@@ -211,6 +322,16 @@ class OpenGL3DViewport(QOpenGLWidget):
         self.show_orbit = True
         self.show_earth = True
         self.show_grid = False
+        
+        # Cached camera matrices, rebuilt only after the camera changes; the
+        # tracking offset is applied on top of the cached camera matrix
+        self._proj_dirty = True
+        self._view_dirty = True
+        self._track_dirty = True
+        self._projection_matrix = None
+        self._camera_matrix = None
+        self._view_matrix = None
+        self._mvp_data = None
     
     def initializeGL(self):
         """Initialize OpenGL context"""
@@ -221,9 +342,18 @@ class OpenGL3DViewport(QOpenGLWidget):
         
         # Initialize shaders
         self.init_shaders()
+        self._mvp_location = -1
+        self._model_location = -1
+        if self.shader_program:
+            self._mvp_location = glGetUniformLocation(self.shader_program, "mvp_matrix")
+            self._model_location = glGetUniformLocation(self.shader_program, "model_matrix")
+            glUseProgram(self.shader_program)
+            glUniformMatrix4fv(self._model_location, 1, GL_FALSE, _IDENTITY_MATRIX)
+            glUseProgram(0)
         
         # Initialize geometry
         self.init_geometry()
+        self.init_buffers()
     
     def init_shaders(self):
         """Initialize OpenGL shaders"""
@@ -231,16 +361,17 @@ class OpenGL3DViewport(QOpenGLWidget):
         vertex_shader = """
         #version 330 core
         layout (location = 0) in vec3 position;
-        layout (location = 1) in vec3 color;
+        layout (location = 1) in vec4 color;
         
         uniform mat4 mvp_matrix;
+        uniform mat4 model_matrix;
         
         out vec3 vertex_color;
         
         void main()
         {
-            gl_Position = mvp_matrix * vec4(position, 1.0);
-            vertex_color = color;
+            gl_Position = mvp_matrix * model_matrix * vec4(position, 1.0);
+            vertex_color = color.rgb;
         }
         """
         
@@ -268,116 +399,133 @@ class OpenGL3DViewport(QOpenGLWidget):
     def init_geometry(self):
         """Initialize 3D geometry"""
         # Create Earth sphere vertices
-        self.earth_vertices = self.create_sphere_vertices(self.earth_radius, 32, 16)
+        self.earth_vertices = sphere_vertices(self.earth_radius, 32, 16)
+        self.earth_indices = sphere_indices(32, 16)
         
         # Create spacecraft vertices (simple cube for now)
-        self.spacecraft_vertices = self.create_cube_vertices(10)  # 10km cube
+        self.spacecraft_vertices = cube_vertices(10)  # 10km cube
+        self.spacecraft_indices = cube_indices()
         
         # Create grid vertices
-        self.grid_vertices = self.create_grid_vertices(20000, 100)  # 20,000km grid
+        self.grid_vertices = grid_vertices(20000, 100)  # 20,000km grid
     
-    def create_sphere_vertices(self, radius, lon_segments, lat_segments):
-        """Create vertices for a sphere"""
-        vertices = []
+    def init_buffers(self):
+        """Upload the static geometry to GPU buffers once"""
+        self.earth_vao, self.earth_vbo, self.earth_ibo = self.upload_static_vertices(
+            self.earth_vertices, self.earth_indices
+        )
+        self.spacecraft_vao, self.spacecraft_vbo, self.spacecraft_ibo = (
+            self.upload_static_vertices(self.spacecraft_vertices, self.spacecraft_indices)
+        )
+        self.grid_vao, self.grid_vbo, _ = self.upload_static_vertices(self.grid_vertices)
+        
+        # Trail positions only; its color is a constant attribute value
+        self.trail_vao = QOpenGLVertexArrayObject(self)
+        self.trail_vao.create()
+        self.trail_vao.bind()
+        self.trail_vbo = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
+        self.trail_vbo.create()
+        self.trail_vbo.setUsagePattern(QOpenGLBuffer.UsagePattern.DynamicDraw)
+        self.trail_vbo.bind()
+        self.trail_vbo.allocate(self.orbital_trail, self.orbital_trail.nbytes)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 12, ctypes.c_void_p(0))
+        self.trail_vao.release()
+        self.trail_vbo.release()
+    
+    def upload_static_vertices(self, vertices, indices=None):
+        """Create a VAO and GL_STATIC_DRAW VBO (and IBO) for VERTEX_DTYPE vertices"""
+        vao = QOpenGLVertexArrayObject(self)
+        vao.create()
+        vao.bind()
+        
+        vbo = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
+        vbo.create()
+        vbo.setUsagePattern(QOpenGLBuffer.UsagePattern.StaticDraw)
+        vbo.bind()
+        vbo.allocate(vertices, vertices.nbytes)
+        
+        # The element buffer binding is VAO state, so bind it while the VAO is
+        ibo = None
+        if indices is not None:
+            ibo = QOpenGLBuffer(QOpenGLBuffer.Type.IndexBuffer)
+            ibo.create()
+            ibo.setUsagePattern(QOpenGLBuffer.UsagePattern.StaticDraw)
+            ibo.bind()
+            ibo.allocate(indices, indices.nbytes)
+        
+        # location 0: float32 xyz, location 1: normalized RGBA8; VERTEX_DTYPE stride
+        stride = VERTEX_DTYPE.itemsize
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(
+            1, 4, GL_UNSIGNED_BYTE, GL_TRUE, stride,
+            ctypes.c_void_p(VERTEX_DTYPE.fields["color"][1])
+        )
         
-        for lat in range(lat_segments + 1):
-            lat_angle = math.pi * lat / lat_segments - math.pi / 2
-            
-            for lon in range(lon_segments + 1):
-                lon_angle = 2 * math.pi * lon / lon_segments
-                
-                x = radius * math.cos(lat_angle) * math.cos(lon_angle)
-                y = radius * math.cos(lat_angle) * math.sin(lon_angle)
-                z = radius * math.sin(lat_angle)
-                
-                # Earth-like coloring
-                if lat_angle > 0:
-                    color = [0.3, 0.7, 0.3]  # Green for land
-                else:
-                    color = [0.2, 0.4, 0.8]  # Blue for oceans
-                
-                vertices.extend([x, y, z] + color)
-        
-        return np.array(vertices, dtype=np.float32)
-    
-    def create_cube_vertices(self, size):
-        """Create vertices for a cube (spacecraft)"""
-        half_size = size / 2
-        vertices = [
-            # Front face (red)
-            -half_size, -half_size,  half_size,  1.0, 0.0, 0.0,
-             half_size, -half_size,  half_size,  1.0, 0.0, 0.0,
-             half_size,  half_size,  half_size,  1.0, 0.0, 0.0,
-            -half_size,  half_size,  half_size,  1.0, 0.0, 0.0,
-            
-            # Back face (green)
-            -half_size, -half_size, -half_size,  0.0, 1.0, 0.0,
-             half_size, -half_size, -half_size,  0.0, 1.0, 0.0,
-             half_size,  half_size, -half_size,  0.0, 1.0, 0.0,
-            -half_size,  half_size, -half_size,  0.0, 1.0, 0.0,
-        ]
-        
-        return np.array(vertices, dtype=np.float32)
-    
-    def create_grid_vertices(self, size, spacing):
-        """Create vertices for a 3D grid"""
-        vertices = []
-        half_size = size / 2
-        
-        # Grid lines in X direction
-        for y in range(-int(half_size), int(half_size) + 1, spacing):
-            for z in range(-int(half_size), int(half_size) + 1, spacing):
-                vertices.extend([-half_size, y, z, 0.2, 0.2, 0.2])
-                vertices.extend([half_size, y, z, 0.2, 0.2, 0.2])
-        
-        # Grid lines in Y direction
-        for x in range(-int(half_size), int(half_size) + 1, spacing):
-            for z in range(-int(half_size), int(half_size) + 1, spacing):
-                vertices.extend([x, -half_size, z, 0.2, 0.2, 0.2])
-                vertices.extend([x, half_size, z, 0.2, 0.2, 0.2])
-        
-        # Grid lines in Z direction
-        for x in range(-int(half_size), int(half_size) + 1, spacing):
-            for y in range(-int(half_size), int(half_size) + 1, spacing):
-                vertices.extend([x, y, -half_size, 0.2, 0.2, 0.2])
-                vertices.extend([x, y, half_size, 0.2, 0.2, 0.2])
-        
-        return np.array(vertices, dtype=np.float32)
+        vao.release()
+        vbo.release()
+        if ibo is not None:
+            ibo.release()
+        return vao, vbo, ibo
     
     def paintGL(self):
         """Render the 3D scene"""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
-        if not self.shader_program:
+        shader_program = self.shader_program
+        if not shader_program:
             return
         
-        glUseProgram(self.shader_program)
+        glUseProgram(shader_program)
         
         # Set up camera and projection matrices
-        projection_matrix = self.get_projection_matrix()
-        view_matrix = self.get_view_matrix()
-        mvp_matrix = projection_matrix * view_matrix
+        self._update_matrices()
         
-        # Upload MVP matrix to shader
-        mvp_location = glGetUniformLocation(self.shader_program, "mvp_matrix")
+        # Upload MVP matrix to shader; the location is looked up once in initializeGL
+        mvp_location = self._mvp_location
         if mvp_location != -1:
-            glUniformMatrix4fv(mvp_location, 1, GL_FALSE, mvp_matrix.data())
+            glUniformMatrix4fv(mvp_location, 1, GL_FALSE, self._mvp_data)
+        
+        show_earth, show_orbit, show_grid = self.show_earth, self.show_orbit, self.show_grid
         
         # Render Earth
-        if self.show_earth:
+        if show_earth:
             self.render_earth()
         
         # Render spacecraft
         self.render_spacecraft()
         
         # Render orbital trail
-        if self.show_orbit:
+        if show_orbit:
             self.render_orbital_trail()
         
         # Render grid
-        if self.show_grid:
+        if show_grid:
             self.render_grid()
     
+    def _update_matrices(self):
+        """Rebuild whichever camera matrices are dirty and the MVP upload data"""
+        if not (self._proj_dirty or self._view_dirty or self._track_dirty):
+            return
+        if self._proj_dirty:
+            self._projection_matrix = self.get_projection_matrix()
+            self._proj_dirty = False
+        if self._view_dirty:
+            self._camera_matrix = self.get_view_matrix()
+            self._view_dirty = False
+        
+        # Tracking only shifts the world under the cached camera
+        self._view_matrix = QMatrix4x4(self._camera_matrix)
+        if self.tracking_enabled:
+            x, y, z = (float(v) for v in self.spacecraft_position)
+            self._view_matrix.translate(-x, -y, -z)
+        self._track_dirty = False
+        
+        mvp_matrix = self._projection_matrix * self._view_matrix
+        self._mvp_data = np.array(mvp_matrix.data(), dtype=np.float32)
+    
     def get_projection_matrix(self):
         """Get projection matrix"""
         aspect_ratio = self.width() / max(self.height(), 1)
@@ -386,7 +534,7 @@ class OpenGL3DViewport(QOpenGLWidget):
         return projection
     
     def get_view_matrix(self):
-        """Get view matrix"""
+        """Get the camera view matrix, without the spacecraft tracking offset"""
         view = QMatrix4x4()
         
         # Apply zoom
@@ -397,37 +545,70 @@ class OpenGL3DViewport(QOpenGLWidget):
         view.rotate(self.camera_rotation_x, 1, 0, 0)
         view.rotate(self.camera_rotation_y, 0, 1, 0)
         
-        # Track spacecraft if enabled
-        if self.tracking_enabled:
-            view.translate(-self.spacecraft_position[0], 
-                         -self.spacecraft_position[1], 
-                         -self.spacecraft_position[2])
-        
         return view
     
     def render_earth(self):
         """Render Earth sphere"""
-        # Implementation would use vertex buffers to render Earth
-        pass
+        self.earth_vao.bind()
+        glDrawElements(GL_TRIANGLE_STRIP, self.earth_indices.size, GL_UNSIGNED_SHORT, None)
+        self.earth_vao.release()
     
     def render_spacecraft(self):
         """Render spacecraft"""
-        # Implementation would render spacecraft at current position
-        pass
+        if self._model_location == -1:
+            return
+        
+        # Place the cube at the spacecraft position, then restore identity
+        model_data = _IDENTITY_MATRIX.copy()
+        model_data[12:15] = self.spacecraft_position  # column-major translation
+        glUniformMatrix4fv(self._model_location, 1, GL_FALSE, model_data)
+        
+        self.spacecraft_vao.bind()
+        glDrawElements(GL_TRIANGLES, self.spacecraft_indices.size, GL_UNSIGNED_SHORT, None)
+        self.spacecraft_vao.release()
+        
+        glUniformMatrix4fv(self._model_location, 1, GL_FALSE, _IDENTITY_MATRIX)
     
     def render_orbital_trail(self):
         """Render orbital trail"""
-        # Implementation would render orbital trail as line strip
-        pass
+        if self.trail_count < 2:
+            return
+        
+        # Attribute 1 is not enabled in the trail VAO, so this constant applies
+        glVertexAttrib4f(1, 1.0, 0.8, 0.2, 1.0)
+        self.trail_vao.bind()
+        head = self.trail_head
+        if self.trail_count < self.trail_capacity or head == 0:
+            glDrawArrays(GL_LINE_STRIP, 0, self.trail_count)
+        else:
+            # Oldest points run from head through the mirror of slot 0
+            glDrawArrays(GL_LINE_STRIP, head, self.trail_capacity - head + 1)
+            glDrawArrays(GL_LINE_STRIP, 0, head)
+        self.trail_vao.release()
+    
+    def trail_points(self):
+        """Trail positions oldest first, as an (n, 3) float32 array"""
+        count, head = self.trail_count, self.trail_head
+        if count < self.trail_capacity or head == 0:
+            return self.orbital_trail[:count]  # contiguous view, no copy
+        return np.concatenate((
+            self.orbital_trail[head:self.trail_capacity], self.orbital_trail[:head]
+        ))
+    
+    def trail_altitudes(self):
+        """Altitude in km of every trail point, oldest first"""
+        return np.linalg.norm(self.trail_points(), axis=1) - self.earth_radius
     
     def render_grid(self):
         """Render reference grid"""
-        # Implementation would render grid lines
-        pass
+        self.grid_vao.bind()
+        glDrawArrays(GL_LINES, 0, self.grid_vertices.size)
+        self.grid_vao.release()
     
     def resizeGL(self, width, height):
         """Handle viewport resize"""
         glViewport(0, 0, width, height)
+        self._proj_dirty = True
     
     def mousePressEvent(self, event):
         """Handle mouse press for camera control"""
@@ -446,6 +627,7 @@ class OpenGL3DViewport(QOpenGLWidget):
             self.camera_rotation_x = max(-90, min(90, self.camera_rotation_x))
             
             self.mouse_last_pos = event.position().toPoint()
+            self._view_dirty = True
             self.update()
     
     def mouseReleaseEvent(self, event):
@@ -458,6 +640,7 @@ class OpenGL3DViewport(QOpenGLWidget):
         zoom_change = 1.1 if delta > 0 else 0.9
         self.zoom_factor *= zoom_change
         self.zoom_factor = max(0.1, min(10.0, self.zoom_factor))
+        self._view_dirty = True
         self.update()
     
     def set_spacecraft(self, spacecraft_id):
@@ -468,11 +651,21 @@ class OpenGL3DViewport(QOpenGLWidget):
     def set_tracking(self, enabled):
         """Set tracking mode"""
         self.tracking_enabled = enabled
+        self._track_dirty = True
         self.update()
     
     def set_zoom(self, zoom_factor):
         """Set zoom factor"""
         self.zoom_factor = zoom_factor
+        self._view_dirty = True
+        self.update()
+    
+    def set_display_options(self, show_earth, show_orbit, show_grid):
+        """Set which scene layers are drawn, repainting only on change"""
+        options = (show_earth, show_orbit, show_grid)
+        if options == (self.show_earth, self.show_orbit, self.show_grid):
+            return
+        self.show_earth, self.show_orbit, self.show_grid = options
         self.update()
     
     def reset_camera(self):
@@ -480,25 +673,41 @@ class OpenGL3DViewport(QOpenGLWidget):
         self.camera_rotation_x = 0
         self.camera_rotation_y = 0
         self.zoom_factor = 1.0
+        self._view_dirty = True
         self.update()
     
-    def update_spacecraft_data(self, spacecraft_data=None):
-        """Update spacecraft position and orbital data"""
-        if spacecraft_data is None:
-            spacecraft_data = data_provider.get_spacecraft_data(self.spacecraft_id)
+    def update_spacecraft_data(self, spacecraft_state=None):
+        """Update spacecraft position from a SPACECRAFT_STATE_DTYPE record"""
+        if spacecraft_state is None:
+            spacecraft_state = data_provider.get_spacecraft_state(self.spacecraft_id)
         
-        # Update spacecraft position
-        position = spacecraft_data.get("position", {})
-        self.spacecraft_position = [
-            position.get("x", 0),
-            position.get("y", 0), 
-            position.get("z", 400)  # Default altitude
-        ]
-        
-        # Update orbital trail
-        self.orbital_trail.append(self.spacecraft_position.copy())
-        if len(self.orbital_trail) > 100:  # Keep last 100 positions
-            self.orbital_trail.pop(0)
+        # Update spacecraft position; a stationary spacecraft needs no repaint
+        new_position = spacecraft_state["pos"]
+        if self.trail_count and np.allclose(new_position, self.spacecraft_position):
+            return
+        self.spacecraft_position = new_position
+        self.spacecraft_velocity = spacecraft_state["vel"]
+        if self.tracking_enabled:
+            self._track_dirty = True
+        
+        # Update orbital trail: overwrite the oldest slot, upload just that vertex
+        head = self.trail_head
+        self.orbital_trail[head] = self.spacecraft_position
+        slots = [head]
+        if head == 0:
+            self.orbital_trail[self.trail_capacity] = self.orbital_trail[0]
+            slots.append(self.trail_capacity)
+        
+        if self.trail_vbo is not None:
+            self.makeCurrent()
+            self.trail_vbo.bind()
+            for slot in slots:
+                glBufferSubData(GL_ARRAY_BUFFER, slot * 12, 12, self.orbital_trail[slot])
+            self.trail_vbo.release()
+            self.doneCurrent()
+        
+        self.trail_head = (head + 1) % self.trail_capacity
+        self.trail_count = min(self.trail_count + 1, self.trail_capacity)
         
         self.update()
 
@@ -541,48 +750,83 @@ class Mock3DViewport(QWidget):
         """Mock method"""
         pass
     
+    def set_display_options(self, show_earth, show_orbit, show_grid):
+        """Mock method"""
+        pass
+    
     def reset_camera(self):
         """Mock method"""
         pass
     
-    def update_spacecraft_data(self, spacecraft_data):
+    def update_spacecraft_data(self, spacecraft_state):
         """Mock method"""
         pass
 
 
+EARTH_RADIUS_KM = 6371.0
+GRAVITATIONAL_PARAMETER = 398600.4418  # km³/s²
+
+
+@njit(cache=True)
+def orbital_period(altitude):
+    """Circular orbital period in minutes for an altitude in km"""
+    semi_major_axis = EARTH_RADIUS_KM + altitude
+    return 2 * math.pi * math.sqrt(semi_major_axis ** 3 / GRAVITATIONAL_PARAMETER) / 60
+
+
+@njit(cache=True)
+def orbital_velocity(altitude):
+    """Circular orbital velocity in km/s for an altitude in km"""
+    return math.sqrt(GRAVITATIONAL_PARAMETER / (EARTH_RADIUS_KM + altitude))
+
+
+@njit(cache=True)
+def eci_to_geographic(x, y, z):
+    """Convert ECI coordinates in km to (latitude, longitude, altitude)"""
+    # Simplified conversion - would need GMST for accurate conversion
+    radius = math.sqrt(x * x + y * y + z * z)
+    longitude = math.atan2(y, x) * 180 / math.pi
+    latitude = math.asin(z / radius) * 180 / math.pi
+    return latitude, longitude, radius - EARTH_RADIUS_KM
+
+
+@njit(parallel=True, cache=True)
+def eci_to_geographic_batch(xyz):
+    """Convert an (N, 3) array of ECI positions to (N, 3) latitude/longitude/altitude"""
+    result = np.empty((xyz.shape[0], 3), dtype=np.float64)
+    for i in prange(xyz.shape[0]):
+        result[i, 0], result[i, 1], result[i, 2] = eci_to_geographic(
+            xyz[i, 0], xyz[i, 1], xyz[i, 2]
+        )
+    return result
+
+
+# Memoized per 0.1 km altitude bucket; valid because the Earth radius and
+# gravitational parameter above are constants
+@lru_cache(maxsize=1024)
+def _period_cached(alt_bucket):
+    return orbital_period(alt_bucket)
+
+
+@lru_cache(maxsize=1024)
+def _velocity_cached(alt_bucket):
+    return orbital_velocity(alt_bucket)
+
+
 class OrbitalMechanicsCalculator:
     """Utility class for orbital mechanics calculations"""
     
     @staticmethod
     def calculate_orbital_period(altitude):
         """Calculate orbital period for given altitude"""
-        earth_radius = 6371  # km
-        gravitational_parameter = 398600.4418  # km³/s²
-        
-        semi_major_axis = earth_radius + altitude
-        period_seconds = 2 * math.pi * math.sqrt(
-            semi_major_axis**3 / gravitational_parameter
-        )
-        
-        return period_seconds / 60  # Convert to minutes
+        return _period_cached(round(float(altitude), 1))  # minutes
     
     @staticmethod
     def calculate_orbital_velocity(altitude):
         """Calculate orbital velocity for given altitude"""
-        earth_radius = 6371  # km
-        gravitational_parameter = 398600.4418  # km³/s²
-        
-        orbital_radius = earth_radius + altitude
-        velocity = math.sqrt(gravitational_parameter / orbital_radius)
-        
-        return velocity  # km/s
+        return _velocity_cached(round(float(altitude), 1))  # km/s
     
     @staticmethod
     def eci_to_geographic(x, y, z, timestamp):
         """Convert ECI coordinates to geographic coordinates"""
-        # Simplified conversion - would need GMST for accurate conversion
-        longitude = math.atan2(y, x) * 180 / math.pi
-        latitude = math.asin(z / math.sqrt(x*x + y*y + z*z)) * 180 / math.pi
-        altitude = math.sqrt(x*x + y*y + z*z) - 6371
-        
-        return latitude, longitude, altitude
+        return eci_to_geographic(float(x), float(y), float(z))
@@ -4,132 +4,387 @@ IoST GUI Widgets
 Additional custom widgets for the Internet of Space Things GUI
 """
 
+import html
+import itertools
 import math
+import random
 import sys
+import weakref
+from collections import deque
+from datetime import datetime
 
-from PyQt6.QtCore import QPoint, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPolygon
+import numpy as np
+from PyQt6.QtCore import QBasicTimer, QObject, QPoint, QPointF, QRect, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPolygon,
+    QPolygonF,
+    QStaticText,
+    QTransform,
+)
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
-    QPushButton,
-    QScrollArea,
+    QLineEdit,
+    QTextBrowser,
+    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+# Optional JIT for the chart coordinate transform
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Pass-through stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+# Shared palette
+_WHITE = QColor(255, 255, 255)
+_GRID = QColor(100, 100, 100)
+_PANEL_BG = QColor(16, 33, 62)
+_ACCENT = QColor(0, 255, 136)
+
+# Status circle fills
+_STATUS_BRUSHES = {
+    "operational": QBrush(QColor(0, 255, 0)),
+    "warning": QBrush(QColor(255, 255, 0)),
+    "error": QBrush(QColor(255, 0, 0)),
+    "offline": QBrush(QColor(128, 128, 128)),
+    "unknown": QBrush(QColor(128, 128, 128)),
+}
+
+# Alert level colours
+_ALERT_COLORS = {
+    "critical": "#ff4444",
+    "warning": "#ffaa00",
+    "info": "#4488ff",
+    "success": "#44ff44"
+}
+_ALERT_DEFAULT_COLOR = "#888888"
+
+# Gauge arc start in 1/16th degrees (bottom-left)
+_ARC_START = 225 * 16
+
+
+def _static_label(text, font):
+    """QStaticText with its glyph layout prepared once for the given font"""
+    label = QStaticText(text)
+    label.prepare(QTransform(), font)
+    return label
+
+
+def _baseline_pos(x, y, font):
+    """Top-left point that puts font's baseline at (x, y) for drawStaticText"""
+    return QPointF(x, y - QFontMetrics(font).ascent())
+
+
+@njit(cache=True, fastmath=True)
+def map_samples(data, points, bottom, scale, min_val):
+    """Write the screen y of each sample into column 1 of points"""
+    for i in range(data.size):
+        points[i, 1] = bottom - (data[i] - min_val) * scale
+
+
+class _SampleClock(QObject):
+    """Periodic callback delivered straight to timerEvent, with no signal dispatch"""
+    
+    def __init__(self, interval, callback):
+        super().__init__()
+        self._callback = callback
+        self._timer = QBasicTimer()
+        self._timer.start(interval, self)
+    
+    def timerEvent(self, event):
+        if event.timerId() == self._timer.timerId():
+            self._callback()
+        else:
+            super().timerEvent(event)
+
 
 class RealTimeChart(QWidget):
     """Real-time data visualization widget"""
     
+    # One sample tick shared by every live chart
+    _global_timer = None
+    _instances = weakref.WeakSet()
+    
     def __init__(self, title="Chart", max_points=100):
         super().__init__()
-        self.title = title
+        self._title = title
+        self._title_static = None
         self.max_points = max_points
-        self.data_points = []
-        self.setMinimumSize(300, 200)
         
-        # Update timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.add_sample_data)
-        self.timer.start(1000)  # Update every second
+        # Ring buffer written twice (slot and slot + max_points) so the
+        # ordered window is always one contiguous slice
+        self._samples = np.zeros(2 * max_points, dtype=np.float32)
+        self._index = 0
+        self._count = 0
+        
+        # Sliding-window extrema: (sequence, value) deques kept monotonic
+        # so the current min/max is always at the head
+        self._seq = 0
+        self._min_window = deque()
+        self._max_window = deque()
+        self._min = 0.0
+        self._max = 0.0
+        
+        # Polyline whose point storage is shared with a numpy view
+        self._polygon = None
+        self._points = None
+        self._polygon_rect = None
+        self.setMinimumSize(300, 200)
+        self._update_chart_rect()
+        
+        # Painting resources, built once
+        self._title_pen = QPen(_WHITE)
+        self._title_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._grid_pen = QPen(_GRID, 1)
+        self._line_pen = QPen(_ACCENT, 2)
+        
+        # Background, title and grid; rebuilt only when the size changes
+        self._bg_cache = None
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        
+        # Join the shared update timer
+        RealTimeChart._instances.add(self)
+        if RealTimeChart._global_timer is None:
+            # Update every second
+            RealTimeChart._global_timer = _SampleClock(1000, RealTimeChart._tick)
+    
+    @property
+    def title(self):
+        """Chart title"""
+        return self._title
+    
+    @title.setter
+    def title(self, title):
+        self._title = title
+        self._title_static = None
+        self._bg_cache = None
+        self.update()
+    
+    @classmethod
+    def _tick(cls):
+        """Feed a sample to every live chart"""
+        for chart in list(cls._instances):
+            chart.add_sample_data()
+    
+    @property
+    def data_points(self):
+        """Samples in arrival order, oldest first"""
+        start = (self._index - self._count) % self.max_points
+        return self._samples[start:start + self._count]
     
     def add_data_point(self, value):
         """Add a new data point"""
-        self.data_points.append(value)
-        if len(self.data_points) > self.max_points:
-            self.data_points.pop(0)
-        self.update()
+        if self._count < self.max_points:
+            self._count += 1
+        
+        slot = self._index
+        self._samples[slot] = value
+        self._samples[slot + self.max_points] = value
+        self._index = (slot + 1) % self.max_points
+        
+        # Update the window extrema in amortized O(1)
+        value = float(self._samples[slot])
+        seq = self._seq
+        self._seq += 1
+        while self._min_window and self._min_window[-1][1] >= value:
+            self._min_window.pop()
+        self._min_window.append((seq, value))
+        while self._max_window and self._max_window[-1][1] <= value:
+            self._max_window.pop()
+        self._max_window.append((seq, value))
+        
+        # Drop heads that have slid out of the window
+        oldest = self._seq - self._count
+        if self._min_window[0][0] < oldest:
+            self._min_window.popleft()
+        if self._max_window[0][0] < oldest:
+            self._max_window.popleft()
+        self._min = self._min_window[0][1]
+        self._max = self._max_window[0][1]
+        
+        # New samples only move the data line, so leave the title alone
+        self.update(self._dirty_rect)
+    
+    def resizeEvent(self, event):
+        """Recompute the chart area and invalidate the background cache"""
+        super().resizeEvent(event)
+        self._update_chart_rect()
+        self._bg_cache = None
+    
+    def _update_chart_rect(self):
+        """Cache the plot area and the region repainted per sample"""
+        self._chart_rect = self.rect().adjusted(20, 30, -20, -20)
+        # Grown by the line pen width so antialiased edges are repainted
+        self._dirty_rect = self._chart_rect.adjusted(-2, -2, 2, 2)
     
     def add_sample_data(self):
         """Add sample data for demonstration"""
-        import random
         value = 50 + random.uniform(-10, 10)
         self.add_data_point(value)
     
-    def paintEvent(self, event):
-        """Paint the chart"""
-        painter = QPainter(self)
+    def _render_background(self):
+        """Render the background, title and grid into a pixmap"""
+        pixmap = QPixmap(self.size())
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw background
-        painter.fillRect(self.rect(), QColor(16, 33, 62))
+        painter.fillRect(pixmap.rect(), _PANEL_BG)
         
         # Draw title
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        painter.drawText(10, 20, self.title)
+        painter.setPen(self._title_pen)
+        if self._title_static is None:
+            self._title_static = _static_label(self._title, self._title_font)
+        painter.setFont(self._title_font)
+        painter.drawStaticText(_baseline_pos(10, 20, self._title_font), self._title_static)
         
-        if len(self.data_points) < 2:
+        # Draw grid
+        chart_rect = self._chart_rect
+        painter.setPen(self._grid_pen)
+        for i in range(5):
+            y = chart_rect.top() + chart_rect.height() * i // 4
+            painter.drawLine(chart_rect.left(), y, chart_rect.right(), y)
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the chart"""
+        if self._bg_cache is None:
+            self._bg_cache = self._render_background()
+        
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.drawPixmap(dirty, self._bg_cache, dirty)
+        
+        # Exposes outside the plot area only need the background
+        n = self._count
+        if n < 2 or not dirty.intersects(self._dirty_rect):
             return
         
-        # Calculate chart area
-        chart_rect = self.rect().adjusted(20, 30, -20, -20)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        chart_rect = self._chart_rect
         
-        # Find min/max values
-        min_val = min(self.data_points)
-        max_val = max(self.data_points)
+        # Running min/max values
+        min_val = self._min
+        max_val = self._max
         if min_val == max_val:
             min_val -= 1
             max_val += 1
         
-        # Draw grid
-        painter.setPen(QPen(QColor(100, 100, 100), 1))
-        for i in range(5):
-            y = chart_rect.top() + (chart_rect.height() * i / 4)
-            painter.drawLine(chart_rect.left(), y, chart_rect.right(), y)
+        # Map the samples into the chart area in one pass
+        points = self._polyline_points(n, chart_rect)
+        scale = chart_rect.height() / (max_val - min_val)
+        if NUMBA_AVAILABLE:
+            map_samples(self.data_points, points, chart_rect.bottom(), scale, min_val)
+        else:
+            np.subtract(self.data_points, min_val, out=points[:, 1])
+            points[:, 1] *= -scale
+            points[:, 1] += chart_rect.bottom()
         
         # Draw data line
-        painter.setPen(QPen(QColor(0, 255, 136), 2))
-        for i in range(len(self.data_points) - 1):
-            x1 = chart_rect.left() + (chart_rect.width() * i / (len(self.data_points) - 1))
-            y1 = chart_rect.bottom() - (chart_rect.height() * (self.data_points[i] - min_val) / (max_val - min_val))
-            
-            x2 = chart_rect.left() + (chart_rect.width() * (i + 1) / (len(self.data_points) - 1))
-            y2 = chart_rect.bottom() - (chart_rect.height() * (self.data_points[i + 1] - min_val) / (max_val - min_val))
-            
-            painter.drawLine(x1, y1, x2, y2)
+        painter.setPen(self._line_pen)
+        painter.drawPolyline(self._polygon)
+    
+    def _polyline_points(self, n, chart_rect):
+        """Return an (n, 2) view onto the polyline's point storage"""
+        if self._polygon is None or self._polygon.size() != n:
+            self._polygon = QPolygonF()
+            self._polygon.fill(QPointF(), n)
+            buffer = self._polygon.data()
+            buffer.setsize(n * 2 * np.dtype(np.float64).itemsize)
+            self._points = np.frombuffer(buffer, dtype=np.float64).reshape(n, 2)
+            self._polygon_rect = None
+        
+        # X positions only depend on the point count and chart area
+        if self._polygon_rect != chart_rect:
+            self._points[:, 0] = np.linspace(
+                chart_rect.left(), chart_rect.left() + chart_rect.width(), n
+            )
+            self._polygon_rect = chart_rect
+        return self._points
 
 
 class StatusIndicator(QWidget):
     """Status indicator widget with color-coded states"""
     
+    # Pre-rendered status circles shared by all indicators, keyed by status
+    _pixmap_cache = {}
+    _CIRCLE_RECT = QRect(3, 3, 24, 24)
+    
     def __init__(self, label="Status", status="unknown"):
         super().__init__()
         self.label = label
         self.status = status
+        self._status_display = status.title()
+        self._label_text = f"{label}: {self._status_display}"
         self.setMinimumSize(100, 30)
+        
+        # Painting resources, built once
+        self._text_pen = QPen(_WHITE)
+        self._label_static = None
+    
+    @classmethod
+    def _get_circle(cls, status):
+        """Antialiased status circle, rendered on first use"""
+        if status not in _STATUS_BRUSHES:
+            status = "unknown"
+        pixmap = cls._pixmap_cache.get(status)
+        if pixmap is None:
+            pixmap = QPixmap(24, 24)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(_STATUS_BRUSHES[status])
+            painter.setPen(QPen(_WHITE, 2))
+            painter.drawEllipse(2, 2, 20, 20)
+            painter.end()
+            cls._pixmap_cache[status] = pixmap
+        return pixmap
     
     def set_status(self, status):
         """Set the status and update display"""
+        if status == self.status:
+            return
         self.status = status
+        self._status_display = status.title()
+        self._label_text = f"{self.label}: {self._status_display}"
+        self._label_static = None
         self.update()
     
     def paintEvent(self, event):
         """Paint the status indicator"""
+        dirty = event.rect()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Status colors
-        colors = {
-            "operational": QColor(0, 255, 0),
-            "warning": QColor(255, 255, 0),
-            "error": QColor(255, 0, 0),
-            "offline": QColor(128, 128, 128),
-            "unknown": QColor(128, 128, 128)
-        }
-        
-        color = colors.get(self.status, colors["unknown"])
         
         # Draw status circle
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
-        painter.drawEllipse(5, 5, 20, 20)
+        if dirty.intersects(self._CIRCLE_RECT):
+            painter.drawPixmap(self._CIRCLE_RECT.topLeft(), self._get_circle(self.status))
         
         # Draw label
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.drawText(30, 20, f"{self.label}: {self.status.title()}")
+        if self._label_static is None:
+            self._label_static = _static_label(self._label_text, self.font())
+        label_pos = _baseline_pos(30, 20, self.font())
+        if dirty.intersects(QRectF(label_pos, self._label_static.size()).toAlignedRect()):
+            painter.setPen(self._text_pen)
+            painter.drawStaticText(label_pos, self._label_static)
 
 
 class GaugeWidget(QWidget):
@@ -137,51 +392,124 @@ class GaugeWidget(QWidget):
     
     def __init__(self, title="Gauge", min_val=0, max_val=100, value=0):
         super().__init__()
-        self.title = title
+        self._title = title
+        self._title_static = None
         self.min_val = min_val
         self.max_val = max_val
         self.value = value
         self.setMinimumSize(150, 150)
+        
+        # Painting resources, built once
+        self._ring_pen = QPen(_GRID, 3)
+        self._arc_pen = QPen(_ACCENT, 5)
+        self._outline_pen = QPen(_WHITE, 2)
+        self._text_pen = QPen(_WHITE)
+        self._center_brush = QBrush(_PANEL_BG)
+        self._value_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._title_font = QFont("Arial", 10)
+        
+        # Arc span in 1/16th degrees and gauge geometry
+        self._span_angle = self._arc_span(value)
+        self._update_geometry()
+        
+        # Ring, center disc and title; rebuilt only when the size changes
+        self._bg_cache = None
+    
+    @property
+    def title(self):
+        """Gauge title"""
+        return self._title
+    
+    @title.setter
+    def title(self, title):
+        self._title = title
+        self._title_static = None
+        self._bg_cache = None
+        self.update()
     
     def set_value(self, value):
         """Set the gauge value"""
         self.value = max(self.min_val, min(self.max_val, value))
+        self._span_angle = self._arc_span(self.value)
         self.update()
     
-    def paintEvent(self, event):
-        """Paint the gauge"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Calculate gauge dimensions
+    def _arc_span(self, value):
+        """Arc span for a value, in 1/16th degrees"""
+        return int((270 * (value - self.min_val) / (self.max_val - self.min_val)) * 16)
+    
+    def _update_geometry(self):
+        """Cache the gauge center and the rect the ring is drawn in"""
         side = min(self.width(), self.height())
-        center = QPoint(self.width() // 2, self.height() // 2)
+        self._center = QPoint(self.width() // 2, self.height() // 2)
         radius = side // 2 - 10
+        self._ring_rect = QRect(
+            self._center.x() - radius, self._center.y() - radius, radius * 2, radius * 2
+        )
+        # Everything dynamic (arc and value text) falls inside the arc pen's reach
+        self._dial_rect = self._ring_rect.adjusted(-3, -3, 3, 3)
+    
+    def resizeEvent(self, event):
+        """Recompute the gauge geometry and invalidate the background cache"""
+        self._bg_cache = None
+        self._update_geometry()
+        super().resizeEvent(event)
+    
+    def _render_background(self):
+        """Render the gauge ring, center disc and title into a pixmap"""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw gauge background
-        painter.setPen(QPen(QColor(100, 100, 100), 3))
-        painter.drawEllipse(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
+        center = self._center
         
-        # Draw value arc
-        painter.setPen(QPen(QColor(0, 255, 136), 5))
-        start_angle = 225 * 16  # Start at bottom-left
-        span_angle = int((270 * (self.value - self.min_val) / (self.max_val - self.min_val)) * 16)
-        painter.drawArc(center.x() - radius, center.y() - radius, radius * 2, radius * 2, start_angle, span_angle)
+        # Draw gauge background
+        painter.setPen(self._ring_pen)
+        painter.drawEllipse(self._ring_rect)
         
         # Draw center circle
-        painter.setBrush(QBrush(QColor(16, 33, 62)))
-        painter.setPen(QPen(QColor(255, 255, 255), 2))
+        painter.setBrush(self._center_brush)
+        painter.setPen(self._outline_pen)
         painter.drawEllipse(center.x() - 20, center.y() - 20, 40, 40)
         
+        # Draw title
+        painter.setPen(self._text_pen)
+        if self._title_static is None:
+            self._title_static = _static_label(self._title, self._title_font)
+        painter.setFont(self._title_font)
+        painter.drawStaticText(
+            _baseline_pos(center.x() - 30, center.y() + 40, self._title_font),
+            self._title_static
+        )
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the gauge"""
+        if self._bg_cache is None:
+            self._bg_cache = self._render_background()
+        
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.drawPixmap(dirty, self._bg_cache, dirty)
+        
+        # Exposes outside the dial only need the background
+        if not dirty.intersects(self._dial_rect):
+            return
+        
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        center = self._center
+        
+        # Draw value arc
+        painter.setPen(self._arc_pen)
+        painter.drawArc(self._ring_rect, _ARC_START, self._span_angle)
+        
         # Draw value text
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        painter.setPen(self._text_pen)
+        painter.setFont(self._value_font)
         value_text = f"{self.value:.1f}"
         painter.drawText(center.x() - 15, center.y() + 5, value_text)
-        
-        # Draw title
-        painter.setFont(QFont("Arial", 10))
-        painter.drawText(center.x() - 30, center.y() + 40, self.title)
 
 
 class AlertPanel(QFrame):
@@ -189,10 +517,20 @@ class AlertPanel(QFrame):
     
     alert_acknowledged = pyqtSignal(str)
     
+    # Sequence number making every alert id unique
+    _id_gen = itertools.count()
+    
     def __init__(self):
         super().__init__()
         self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.alerts = []
+        # Alert fields as parallel columns, oldest first
+        self._keys = deque(maxlen=20)
+        self._ids = deque(maxlen=20)
+        self._levels = deque(maxlen=20)
+        self._messages = deque(maxlen=20)
+        self._timestamps = deque(maxlen=20)
+        self._id_by_key = {}
+        self._acknowledged = set()
         self.init_ui()
     
     def init_ui(self):
@@ -204,92 +542,106 @@ class AlertPanel(QFrame):
         header_label.setStyleSheet("font-weight: bold; font-size: 14px; color: white;")
         layout.addWidget(header_label)
         
-        # Scroll area for alerts
-        self.scroll_area = QScrollArea()
-        self.scroll_widget = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_widget)
-        self.scroll_area.setWidget(self.scroll_widget)
-        self.scroll_area.setWidgetResizable(True)
-        layout.addWidget(self.scroll_area)
+        # All alerts render as rich text in one view; acks are anchor clicks
+        self.alert_view = QTextBrowser()
+        self.alert_view.setOpenLinks(False)
+        self.alert_view.anchorClicked.connect(self._on_anchor_clicked)
+        layout.addWidget(self.alert_view)
     
     def add_alert(self, level, message, timestamp=None):
         """Add a new alert"""
         if timestamp is None:
-            from datetime import datetime
             timestamp = datetime.now().strftime("%H:%M:%S")
         
-        alert_widget = AlertWidget(level, message, timestamp)
-        alert_widget.acknowledged.connect(self.on_alert_acknowledged)
-        
-        self.scroll_layout.insertWidget(0, alert_widget)  # Add to top
-        self.alerts.append(alert_widget)
-        
-        # Limit number of alerts
-        if len(self.alerts) > 20:
-            old_alert = self.alerts.pop(0)
-            old_alert.deleteLater()
+        key = next(AlertPanel._id_gen)
+        alert_id = f"{timestamp}:{level}:{key}"
+        
+        # Limit number of alerts; the columns evict their oldest entry together
+        if len(self._ids) == self._ids.maxlen:
+            del self._id_by_key[self._keys[0]]
+            self._acknowledged.discard(self._ids[0])
+        self._keys.append(key)
+        self._ids.append(alert_id)
+        self._levels.append(level)
+        self._messages.append(message)
+        self._timestamps.append(timestamp)
+        self._id_by_key[key] = alert_id
+        self._render()
+    
+    def _render(self):
+        """Rewrite the alert view, newest alert first"""
+        rows = []
+        columns = zip(self._keys, self._ids, self._levels, self._messages, self._timestamps)
+        for key, alert_id, level, message, timestamp in reversed(list(columns)):
+            color = _ALERT_COLORS.get(level, _ALERT_DEFAULT_COLOR)
+            background = (
+                " background-color: rgba(100, 100, 100, 50);"
+                if alert_id in self._acknowledged else ""
+            )
+            rows.append(
+                f'<p style="margin: 2px;{background}">'
+                f'<span style="color: {color}; font-size: 16px;">●</span> '
+                f'<span style="color: white;">[{html.escape(timestamp)}] {html.escape(message)}</span> '
+                f'<a href="ack:{key}" style="color: white; text-decoration: none;">✓</a>'
+                f'</p>'
+            )
+        self.alert_view.setHtml("".join(rows))
+    
+    def _on_anchor_clicked(self, url):
+        """Acknowledge the alert whose ✓ link was clicked"""
+        alert_id = self._id_by_key.get(int(url.path()))
+        if alert_id is not None:
+            self._acknowledged.add(alert_id)
+            self._render()
+            self.on_alert_acknowledged(alert_id)
     
     def on_alert_acknowledged(self, alert_id):
         """Handle alert acknowledgment"""
         self.alert_acknowledged.emit(alert_id)
 
 
-class AlertWidget(QWidget):
-    """Individual alert widget"""
-    
-    acknowledged = pyqtSignal(str)
-    
-    def __init__(self, level, message, timestamp):
-        super().__init__()
-        self.level = level
-        self.message = message
-        self.timestamp = timestamp
-        self.alert_id = f"{timestamp}_{level}_{hash(message)}"
-        self.init_ui()
-    
-    def init_ui(self):
-        """Initialize alert widget UI"""
-        layout = QHBoxLayout(self)
-        
-        # Alert level indicator
-        level_colors = {
-            "critical": "#ff4444",
-            "warning": "#ffaa00", 
-            "info": "#4488ff",
-            "success": "#44ff44"
-        }
-        
-        level_indicator = QLabel("●")
-        level_indicator.setStyleSheet(f"color: {level_colors.get(self.level, '#888888')}; font-size: 16px;")
-        layout.addWidget(level_indicator)
-        
-        # Alert message
-        message_label = QLabel(f"[{self.timestamp}] {self.message}")
-        message_label.setWordWrap(True)
-        message_label.setStyleSheet("color: white;")
-        layout.addWidget(message_label, 1)
-        
-        # Acknowledge button
-        ack_button = QPushButton("✓")
-        ack_button.setMaximumSize(30, 30)
-        ack_button.clicked.connect(self.acknowledge)
-        layout.addWidget(ack_button)
-    
-    def acknowledge(self):
-        """Acknowledge this alert"""
-        self.acknowledged.emit(self.alert_id)
-        self.setStyleSheet("background-color: rgba(100, 100, 100, 50);")
-
-
 class ConsoleWidget(QWidget):
     """Console widget for command input and output"""
     
     command_executed = pyqtSignal(str)
     
+    # Fixed command output
+    _HELP_LINES = (
+        "Available commands:",
+        "  help - Show this help",
+        "  status - Show system status",
+        "  satellites - List satellites",
+        "  clear - Clear console",
+        "  exit - Close console",
+    )
+    _STATUS_LINES = (
+        "System Status: Operational",
+        "Active Satellites: 15",
+        "CEHSN Status: Active",
+        "Network Health: 94%",
+    )
+    _SATELLITE_LINES = (
+        "  ISS - Operational",
+        "  Luna Gateway - Operational",
+        "  Crew Dragon - In Transit",
+        "  CubeSat-Alpha - Active",
+        "  CubeSat-Beta - Active",
+    )
+    
     def __init__(self):
         super().__init__()
-        self.command_history = []
+        # Bounded so long-running sessions don't grow without limit
+        self.command_history = deque(maxlen=500)
         self.history_index = -1
+        
+        # Command name -> handler taking the full command text
+        self._handlers = {
+            "help": self._cmd_help,
+            "status": self._cmd_status,
+            "satellites": self._cmd_satellites,
+            "clear": self._cmd_clear,
+            "exit": self._cmd_exit,
+        }
         self.init_ui()
     
     def init_ui(self):
@@ -297,7 +649,6 @@ class ConsoleWidget(QWidget):
         layout = QVBoxLayout(self)
         
         # Output area
-        from PyQt6.QtWidgets import QLineEdit, QTextEdit
         self.output_area = QTextEdit()
         self.output_area.setReadOnly(True)
         self.output_area.setStyleSheet("""
@@ -328,14 +679,20 @@ class ConsoleWidget(QWidget):
         layout.addLayout(input_layout)
         
         # Add welcome message
-        self.add_output("IoST Command Console v1.0")
-        self.add_output("Type 'help' for available commands")
-        self.add_output("=" * 40)
+        self.add_output_lines((
+            "IoST Command Console v1.0",
+            "Type 'help' for available commands",
+            "=" * 40,
+        ))
     
     def add_output(self, text):
         """Add text to output area"""
         self.output_area.append(text)
     
+    def add_output_lines(self, lines):
+        """Add several lines to the output area in one append"""
+        self.output_area.append("\n".join(lines))
+    
     def execute_command(self):
         """Execute the entered command"""
         command = self.command_input.text().strip()
@@ -362,42 +719,35 @@ class ConsoleWidget(QWidget):
         if not parts:
             return
         
-        cmd = parts[0]
-        
-        if cmd == "help":
-            self.add_output("Available commands:")
-            self.add_output("  help - Show this help")
-            self.add_output("  status - Show system status")
-            self.add_output("  satellites - List satellites")
-            self.add_output("  clear - Clear console")
-            self.add_output("  exit - Close console")
-        
-        elif cmd == "status":
-            self.add_output("System Status: Operational")
-            self.add_output("Active Satellites: 15")
-            self.add_output("CEHSN Status: Active")
-            self.add_output("Network Health: 94%")
-        
-        elif cmd == "satellites":
-            satellites = [
-                "ISS - Operational",
-                "Luna Gateway - Operational", 
-                "Crew Dragon - In Transit",
-                "CubeSat-Alpha - Active",
-                "CubeSat-Beta - Active"
-            ]
-            for sat in satellites:
-                self.add_output(f"  {sat}")
-        
-        elif cmd == "clear":
-            self.output_area.clear()
-        
-        elif cmd == "exit":
-            self.add_output("Console closed.")
-        
-        else:
-            self.add_output(f"Unknown command: {command}")
-            self.add_output("Type 'help' for available commands")
+        handler = self._handlers.get(parts[0], self._cmd_unknown)
+        handler(command)
         
         # Emit signal for external handling
         self.command_executed.emit(command)
+    
+    def _cmd_help(self, command):
+        """List the available commands"""
+        self.add_output_lines(self._HELP_LINES)
+    
+    def _cmd_status(self, command):
+        """Show system status"""
+        self.add_output_lines(self._STATUS_LINES)
+    
+    def _cmd_satellites(self, command):
+        """List satellites"""
+        self.add_output_lines(self._SATELLITE_LINES)
+    
+    def _cmd_clear(self, command):
+        """Clear the output area"""
+        self.output_area.clear()
+    
+    def _cmd_exit(self, command):
+        """Close the console"""
+        self.add_output("Console closed.")
+    
+    def _cmd_unknown(self, command):
+        """Report an unrecognised command"""
+        self.add_output_lines((
+            f"Unknown command: {command}",
+            "Type 'help' for available commands",
+        ))
@@ -10,8 +10,11 @@ import logging
 import os
 import signal
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 # Add src to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -39,6 +42,162 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Seconds a get_enhanced_system_status snapshot is reused
+_STATUS_CACHE_TTL = 1.0
+
+# Environment used by the adaptive-communication demo, shared read-only
+_DEFAULT_ENV = MappingProxyType({
+    "weather": "clear",
+    "atmospheric_loss": 0.5,
+    "interference": 0.1,
+    "distance": 1000
+})
+
+# Frequency bands by enum member name, resolved once
+_BAND_BY_NAME = {band.name: band for band in FrequencyBand}
+
+
+@dataclass(frozen=True)
+class CubeSatConfig:
+    """Immutable build description for one constellation CubeSat"""
+    id: str
+    name: str
+    size: CubeSatSize
+    altitude: int  # km
+    role: str
+    antennas: Tuple[Mapping, ...]
+    transceivers: Tuple[Mapping, ...]
+    payload: Mapping
+
+
+# IoST constellation, built once at import; nested configs are read-only views
+_CUBESAT_CONFIGS: Tuple[CubeSatConfig, ...] = (
+    CubeSatConfig(
+        id="CUBESAT-COMMAND-001",
+        name="IoST Command Node",
+        size=CubeSatSize.SIX_U,
+        altitude=550,
+        role="gateway",
+        antennas=(
+            MappingProxyType({
+                "id": "ant_cmd_1",
+                "type": "programmable",
+                "bands": ("S_BAND", "X_BAND", "KA_BAND"),
+                "frequency": 8.4e9,
+                "gain": 25.0,
+                "steerable": True
+            }),
+        ),
+        transceivers=(
+            MappingProxyType({
+                "id": "sdr_cmd_1",
+                "bands": ("MICROWAVE", "MILLIMETER_WAVE"),
+                "ai_processing": True,
+                "cognitive_radio": True
+            }),
+        ),
+        payload=MappingProxyType({
+            "id": "cmd_payload_1",
+            "type": "communication",
+            "sensors": ("iot_relay",),
+            "ai_models": ("routing_optimization", "interference_mitigation")
+        })
+    ),
+    CubeSatConfig(
+        id="CUBESAT-EARTH-OBS-001",
+        name="IoST Earth Observation",
+        size=CubeSatSize.TWELVE_U,
+        altitude=700,
+        role="node",
+        antennas=(
+            MappingProxyType({
+                "id": "ant_eo_1",
+                "type": "phased_array",
+                "bands": ("X_BAND", "KU_BAND"),
+                "frequency": 12e9,
+                "gain": 30.0,
+                "steerable": True
+            }),
+        ),
+        transceivers=(
+            MappingProxyType({
+                "id": "sdr_eo_1",
+                "bands": ("MICROWAVE", "OPTICAL"),
+                "ai_processing": True,
+                "cognitive_radio": True
+            }),
+        ),
+        payload=MappingProxyType({
+            "id": "eo_payload_1",
+            "type": "remote_sensing",
+            "sensors": ("earth_observation", "atmospheric"),
+            "ai_models": ("image_processing", "anomaly_detection")
+        })
+    ),
+    CubeSatConfig(
+        id="CUBESAT-IOT-GATEWAY-001",
+        name="IoST IoT Gateway",
+        size=CubeSatSize.THREE_U,
+        altitude=450,
+        role="relay",
+        antennas=(
+            MappingProxyType({
+                "id": "ant_iot_1",
+                "type": "programmable",
+                "bands": ("UHF", "S_BAND", "C_BAND"),
+                "frequency": 2.4e9,
+                "gain": 15.0,
+                "steerable": False
+            }),
+        ),
+        transceivers=(
+            MappingProxyType({
+                "id": "sdr_iot_1",
+                "bands": ("MICROWAVE",),
+                "ai_processing": True,
+                "cognitive_radio": True
+            }),
+        ),
+        payload=MappingProxyType({
+            "id": "iot_payload_1",
+            "type": "iot_gateway",
+            "sensors": ("iot_relay", "atmospheric"),
+            "ai_models": ("traffic_prediction", "load_balancing")
+        })
+    ),
+    CubeSatConfig(
+        id="CUBESAT-RESEARCH-001",
+        name="IoST Research Platform",
+        size=CubeSatSize.SIX_U,
+        altitude=850,
+        role="sink",
+        antennas=(
+            MappingProxyType({
+                "id": "ant_res_1",
+                "type": "helical",
+                "bands": ("KA_BAND", "MILLIMETER_WAVE"),
+                "frequency": 35e9,
+                "gain": 35.0,
+                "steerable": True
+            }),
+        ),
+        transceivers=(
+            MappingProxyType({
+                "id": "sdr_res_1",
+                "bands": ("MILLIMETER_WAVE", "TERAHERTZ"),
+                "ai_processing": True,
+                "cognitive_radio": True
+            }),
+        ),
+        payload=MappingProxyType({
+            "id": "res_payload_1",
+            "type": "scientific",
+            "sensors": ("atmospheric", "iot_relay"),
+            "ai_models": ("data_fusion", "scientific_analysis")
+        })
+    ),
+)
+
 
 class EnhancedIoSPlatform:
     """Enhanced Internet of Space Things platform with IoST capabilities"""
@@ -56,203 +215,96 @@ class EnhancedIoSPlatform:
         self.cubesat_constellation: Dict[str, CubeSat] = {}
         self.multiband_radios: Dict[str, MultibandRadio] = {}
         
+        # CubeSats push (cubesat_id, health_score) here when their health changes
+        self._health_events: asyncio.Queue = asyncio.Queue()
+        
         # Environmental sensors
         self.radiation_detector = RadiationDetector("RAD_001")
         
         self.running = False
         
+        # Last status snapshot and its time.monotonic() stamp
+        self._status_cache = None
+        self._status_cache_ts = 0.0
+        
         logger.info("Enhanced IoST Platform initialized with SDN and multiband communication")
     
     async def initialize_cubesat_constellation(self):
         """Initialize the CubeSat constellation with IoST capabilities"""
         logger.info("Initializing IoST CubeSat constellation...")
         
-        # Define CubeSat configurations
-        cubesat_configs = [
-            {
-                "id": "CUBESAT-COMMAND-001",
-                "name": "IoST Command Node",
-                "size": CubeSatSize.SIX_U,
-                "altitude": 550,  # km
-                "role": "gateway",
-                "antennas": [
-                    {
-                        "id": "ant_cmd_1",
-                        "type": "programmable",
-                        "bands": ["S_BAND", "X_BAND", "KA_BAND"],
-                        "frequency": 8.4e9,
-                        "gain": 25.0,
-                        "steerable": True
-                    }
-                ],
-                "transceivers": [
-                    {
-                        "id": "sdr_cmd_1",
-                        "bands": ["MICROWAVE", "MILLIMETER_WAVE"],
-                        "ai_processing": True,
-                        "cognitive_radio": True
-                    }
-                ],
-                "payload": {
-                    "id": "cmd_payload_1",
-                    "type": "communication",
-                    "sensors": ["iot_relay"],
-                    "ai_models": ["routing_optimization", "interference_mitigation"]
-                }
-            },
-            {
-                "id": "CUBESAT-EARTH-OBS-001",
-                "name": "IoST Earth Observation",
-                "size": CubeSatSize.TWELVE_U,
-                "altitude": 700,
-                "role": "node",
-                "antennas": [
-                    {
-                        "id": "ant_eo_1",
-                        "type": "phased_array",
-                        "bands": ["X_BAND", "KU_BAND"],
-                        "frequency": 12e9,
-                        "gain": 30.0,
-                        "steerable": True
-                    }
-                ],
-                "transceivers": [
-                    {
-                        "id": "sdr_eo_1",
-                        "bands": ["MICROWAVE", "OPTICAL"],
-                        "ai_processing": True,
-                        "cognitive_radio": True
-                    }
-                ],
-                "payload": {
-                    "id": "eo_payload_1",
-                    "type": "remote_sensing",
-                    "sensors": ["earth_observation", "atmospheric"],
-                    "ai_models": ["image_processing", "anomaly_detection"]
-                }
-            },
-            {
-                "id": "CUBESAT-IOT-GATEWAY-001", 
-                "name": "IoST IoT Gateway",
-                "size": CubeSatSize.THREE_U,
-                "altitude": 450,
-                "role": "relay",
-                "antennas": [
-                    {
-                        "id": "ant_iot_1",
-                        "type": "programmable",
-                        "bands": ["UHF", "S_BAND", "C_BAND"],
-                        "frequency": 2.4e9,
-                        "gain": 15.0,
-                        "steerable": False
-                    }
-                ],
-                "transceivers": [
-                    {
-                        "id": "sdr_iot_1",
-                        "bands": ["MICROWAVE"],
-                        "ai_processing": True,
-                        "cognitive_radio": True
-                    }
-                ],
-                "payload": {
-                    "id": "iot_payload_1",
-                    "type": "iot_gateway",
-                    "sensors": ["iot_relay", "atmospheric"],
-                    "ai_models": ["traffic_prediction", "load_balancing"]
-                }
-            },
-            {
-                "id": "CUBESAT-RESEARCH-001",
-                "name": "IoST Research Platform",
-                "size": CubeSatSize.SIX_U,
-                "altitude": 850,
-                "role": "sink",
-                "antennas": [
-                    {
-                        "id": "ant_res_1",
-                        "type": "helical",
-                        "bands": ["KA_BAND", "MILLIMETER_WAVE"],
-                        "frequency": 35e9,
-                        "gain": 35.0,
-                        "steerable": True
-                    }
-                ],
-                "transceivers": [
-                    {
-                        "id": "sdr_res_1",
-                        "bands": ["MILLIMETER_WAVE", "TERAHERTZ"],
-                        "ai_processing": True,
-                        "cognitive_radio": True
-                    }
-                ],
-                "payload": {
-                    "id": "res_payload_1",
-                    "type": "scientific",
-                    "sensors": ["atmospheric", "iot_relay"],
-                    "ai_models": ["data_fusion", "scientific_analysis"]
-                }
-            }
-        ]
-        
-        # Create CubeSats
-        for config in cubesat_configs:
-            cubesat = CubeSat(
-                cubesat_id=config["id"],
-                name=config["name"],
-                size=config["size"],
-                orbit_altitude=config["altitude"]
-            )
-            
-            cubesat.network_role = config["role"]
-            
-            # Add programmable antennas
-            for antenna_config in config["antennas"]:
-                await cubesat.add_programmable_antenna(antenna_config)
-            
-            # Add reconfigurable transceivers
-            for transceiver_config in config["transceivers"]:
-                await cubesat.add_reconfigurable_transceiver(transceiver_config)
-            
-            # Set payload
-            await cubesat.set_payload(config["payload"])
-            
-            # Register with SDN controller
-            capabilities = {
-                "antennas": len(config["antennas"]),
-                "transceivers": len(config["transceivers"]),
-                "payload_type": config["payload"]["type"],
-                "ai_processing": True,
-                "mesh_networking": True
-            }
-            await self.sdn_controller.register_cubesat(config["id"], capabilities)
-            
-            # Create multiband radio for each CubeSat
-            supported_bands = []
-            for transceiver in config["transceivers"]:
-                for band_name in transceiver["bands"]:
-                    supported_bands.append(FrequencyBand[band_name])
-            
-            radio = MultibandRadio(f"radio_{config['id']}", supported_bands)
-            self.multiband_radios[config["id"]] = radio
-            
-            self.cubesat_constellation[config["id"]] = cubesat
-            
-            logger.info(f"Created CubeSat: {cubesat.name} ({cubesat.size.value})")
+        # Create CubeSats concurrently; gather keeps the config order
+        results = await asyncio.gather(
+            *(self._build_cubesat(config) for config in _CUBESAT_CONFIGS)
+        )
+        for cubesat, radio in results:
+            self.cubesat_constellation[cubesat.cubesat_id] = cubesat
+            self.multiband_radios[cubesat.cubesat_id] = radio
         
         # Discover network topology
         await self.sdn_controller.discover_network_topology()
         
-        # Enable mesh networking
-        for cubesat_id, cubesat in self.cubesat_constellation.items():
-            neighbors = list(self.cubesat_constellation.keys())
-            neighbors.remove(cubesat_id)
-            await cubesat.enable_mesh_networking(neighbors[:3])  # Connect to 3 neighbors
+        # Enable mesh networking with the first 3 other nodes, built by
+        # slicing around each node instead of copying the full id list
+        all_ids = list(self.cubesat_constellation)
+        mesh_setups = []
+        for idx, cubesat_id in enumerate(all_ids):
+            neighbors = all_ids[:min(idx, 3)]
+            neighbors += all_ids[idx + 1:idx + 1 + 3 - len(neighbors)]
+            mesh_setups.append(
+                self.cubesat_constellation[cubesat_id].enable_mesh_networking(neighbors)
+            )
+        await asyncio.gather(*mesh_setups)
         
         logger.info(
             f"CubeSat constellation initialized with {len(self.cubesat_constellation)} nodes"
         )
     
+    async def _build_cubesat(self, config):
+        """Build one CubeSat and its multiband radio from a configuration"""
+        cubesat = CubeSat(
+            cubesat_id=config.id,
+            name=config.name,
+            size=config.size,
+            orbit_altitude=config.altitude
+        )
+        
+        cubesat.network_role = config.role
+        cubesat.health_events = self._health_events
+        
+        # Add programmable antennas
+        for antenna_config in config.antennas:
+            cubesat.add_programmable_antenna(antenna_config)
+        
+        # Add reconfigurable transceivers
+        for transceiver_config in config.transceivers:
+            cubesat.add_reconfigurable_transceiver(transceiver_config)
+        
+        # Set payload
+        cubesat.set_payload(config.payload)
+        
+        # Register with SDN controller
+        capabilities = {
+            "antennas": len(config.antennas),
+            "transceivers": len(config.transceivers),
+            "payload_type": config.payload["type"],
+            "ai_processing": True,
+            "mesh_networking": True
+        }
+        await self.sdn_controller.register_cubesat(config.id, capabilities)
+        
+        # Create multiband radio for each CubeSat
+        supported_bands = [
+            _BAND_BY_NAME[band_name]
+            for transceiver in config.transceivers
+            for band_name in transceiver["bands"]
+        ]
+        
+        radio = MultibandRadio(f"radio_{config.id}", supported_bands)
+        
+        logger.info(f"Created CubeSat: {cubesat.name} ({cubesat.size.value})")
+        return cubesat, radio
+    
     async def create_network_slices(self):
         """Create network slices for different IoST services"""
         logger.info("Creating network slices for IoST services...")
@@ -355,29 +407,31 @@ class EnhancedIoSPlatform:
         """Demonstrate adaptive multiband communication"""
         logger.info("Demonstrating adaptive multiband communication...")
         
-        for cubesat_id, radio in self.multiband_radios.items():
-            # Simulate varying environmental conditions
-            environment_conditions = {
-                "weather": "clear",
-                "atmospheric_loss": 0.5,
-                "interference": 0.1,
-                "distance": 1000
-            }
-            
-            cubesat = self.cubesat_constellation[cubesat_id]
+        # Every node talks to the first CubeSat; the first talks to the second
+        ids = list(self.cubesat_constellation)
+        if len(ids) > 1:
+            default_target = ids[0]
+            links = [
+                (cubesat_id, ids[1] if cubesat_id == default_target else default_target)
+                for cubesat_id in self.multiband_radios
+            ]
             
             # Demonstrate adaptive communication
-            target_id = next(iter(self.cubesat_constellation.keys()))
-            if target_id != cubesat_id:
-                success = await cubesat.adaptive_communication(
-                    target_id, environment_conditions
+            results = await asyncio.gather(*(
+                self.cubesat_constellation[cubesat_id].adaptive_communication(
+                    target_id, _DEFAULT_ENV
                 )
+                for cubesat_id, target_id in links
+            ))
+            for (cubesat_id, target_id), success in zip(links, results):
                 if success:
                     logger.info(f"{cubesat_id} adapted communication to {target_id}")
         
         # Demonstrate spectrum sensing and optimal band selection
-        for radio_id, radio in self.multiband_radios.items():
-            spectrum_data = await radio.sense_spectrum(1.0)
+        spectra = await asyncio.gather(
+            *(radio.sense_spectrum(1.0) for radio in self.multiband_radios.values())
+        )
+        for radio_id, spectrum_data in zip(self.multiband_radios, spectra):
             logger.info(f"Radio {radio_id} sensed {len(spectrum_data)} frequency bands")
     
     async def simulate_iot_data_relay(self):
@@ -440,6 +494,7 @@ class EnhancedIoSPlatform:
         logger.info("Starting enhanced IoST operations...")
         
         self.running = True
+        self._status_cache = None
         
         # Start background tasks
         tasks = [
@@ -458,23 +513,33 @@ class EnhancedIoSPlatform:
             logger.info("Enhanced operations cancelled")
         finally:
             self.running = False
+            # Cancel the sibling loops and wait for them so none outlive us
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             logger.info("Enhanced operations stopped")
     
     async def _cubesat_monitoring_loop(self):
         """Monitor CubeSat constellation health and status"""
         while self.running:
             try:
-                for cubesat_id, cubesat in self.cubesat_constellation.items():
-                    status = cubesat.get_cubesat_status()
-                    
-                    if status["health_score"] < 0.8:
-                        logger.warning(f"CubeSat {cubesat_id} health degraded: "
-                                     f"{status['health_score']:.2f}")
-                    
-                    # Update last contact time
-                    cubesat.last_contact = datetime.utcnow()
+                try:
+                    cubesat_id, health_score = await asyncio.wait_for(
+                        self._health_events.get(), timeout=30  # Heartbeat every 30 seconds
+                    )
+                except asyncio.TimeoutError:
+                    # No health changes; refresh contact times on the heartbeat
+                    now = datetime.utcnow()
+                    for cubesat in self.cubesat_constellation.values():
+                        cubesat.last_contact = now
+                    continue
                 
-                await asyncio.sleep(30)  # Every 30 seconds
+                if health_score < 0.8:
+                    logger.warning(f"CubeSat {cubesat_id} health degraded: "
+                                 f"{health_score:.2f}")
+                
+                # Update last contact time
+                self.cubesat_constellation[cubesat_id].last_contact = datetime.utcnow()
             except Exception as e:
                 logger.error(f"Error in CubeSat monitoring: {e}")
                 await asyncio.sleep(10)
@@ -497,11 +562,14 @@ class EnhancedIoSPlatform:
         """Monitor and optimize multiband communications"""
         while self.running:
             try:
-                for radio_id, radio in self.multiband_radios.items():
-                    # Perform spectrum sensing
-                    spectrum_data = await radio.sense_spectrum(0.5)
-                    
-                    # Check for interference and mitigate if needed
+                radios = list(self.multiband_radios.values())
+                
+                # Perform spectrum sensing on all radios at once
+                await asyncio.gather(*(radio.sense_spectrum(0.5) for radio in radios))
+                
+                # Check for interference and mitigate if needed
+                mitigations = []
+                for radio in radios:
                     interfered_links = [
                         link_id for link_id, link in radio.active_links.items()
                         if link.channel_conditions and 
@@ -509,10 +577,14 @@ class EnhancedIoSPlatform:
                     ]
                     
                     if interfered_links:
-                        mitigation_results = await radio.cognitive_interference_mitigation(
-                            interfered_links
-                        )
-                        logger.info(f"Mitigated interference on {len(interfered_links)} links")
+                        mitigations.append((radio, interfered_links))
+                
+                await asyncio.gather(*(
+                    radio.cognitive_interference_mitigation(interfered_links)
+                    for radio, interfered_links in mitigations
+                ))
+                for _, interfered_links in mitigations:
+                    logger.info(f"Mitigated interference on {len(interfered_links)} links")
                 
                 await asyncio.sleep(60)  # Every minute
             except Exception as e:
@@ -559,6 +631,7 @@ class EnhancedIoSPlatform:
         logger.info("Shutting down Enhanced IoST Platform...")
         
         self.running = False
+        self._status_cache = None
         
         # Stop environmental monitoring
         await self.radiation_detector.stop_monitoring()
@@ -570,6 +643,10 @@ class EnhancedIoSPlatform:
     
     def get_enhanced_system_status(self):
         """Get comprehensive enhanced system status"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache_ts < _STATUS_CACHE_TTL:
+            return self._status_cache
+        
         sdn_stats = self.sdn_controller.get_network_statistics()
         
         # CubeSat status
@@ -582,7 +659,7 @@ class EnhancedIoSPlatform:
         for radio_id, radio in self.multiband_radios.items():
             radio_status[radio_id] = radio.get_radio_status()
         
-        return {
+        self._status_cache = {
             "timestamp": datetime.utcnow().isoformat(),
             "platform_status": "operational" if self.running else "stopped",
             "cubesat_constellation": cubesat_status,
@@ -592,6 +669,8 @@ class EnhancedIoSPlatform:
             "active_network_slices": sdn_stats["active_slices"],
             "deployed_vnfs": sdn_stats["deployed_vnfs"]
         }
+        self._status_cache_ts = now
+        return self._status_cache
 
 
 async def main():
@@ -216,6 +216,7 @@ class CubeSat:
         
         # Status and health
         self.is_operational = True
+        self.health_events: Optional[asyncio.Queue] = None  # (id, score) updates
         self.health_score = 1.0
         self.last_contact = datetime.utcnow()
         self.total_data_collected = 0.0  # GB
@@ -436,6 +437,18 @@ class CubeSat:
             logger.error(f"Failed to relay IoT data: {e}")
             return False
     
+    @property
+    def health_score(self) -> float:
+        """Overall health, 0.0 (failed) to 1.0 (nominal)"""
+        return self._health_score
+    
+    @health_score.setter
+    def health_score(self, health_score: float):
+        # Every write is published so monitors never miss a change
+        self._health_score = health_score
+        if self.health_events is not None:
+            self.health_events.put_nowait((self.cubesat_id, health_score))
+    
     def get_cubesat_status(self) -> Dict[str, Any]:
         """Get comprehensive CubeSat status"""
         return {
@@ -0,0 +1,52 @@
+"""
+Tests for the IoST GUI data provider
+"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add gui directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'gui'))
+
+from data_provider import SPACECRAFT_STATE_DTYPE, IoSTDataProvider
+
+
+class TestSpacecraftStates:
+    """Test the vectorized spacecraft state records"""
+    
+    @pytest.fixture
+    def provider(self):
+        """Create test data provider"""
+        return IoSTDataProvider()
+    
+    def test_known_id_matches_scalar_state(self, provider):
+        """Test that batch records match the per-spacecraft record"""
+        ids = list(provider.spacecraft_data)
+        states = provider.get_spacecraft_states(ids)
+        
+        assert states.dtype == SPACECRAFT_STATE_DTYPE
+        assert len(states) == len(ids)
+        for i, spacecraft_id in enumerate(ids):
+            state = provider.get_spacecraft_state(spacecraft_id)
+            for field in SPACECRAFT_STATE_DTYPE.names:
+                np.testing.assert_array_equal(states[i][field], state[field])
+    
+    def test_unknown_id_is_zeroed(self, provider):
+        """Test that unknown spacecraft get zeroed records"""
+        known = next(iter(provider.spacecraft_data))
+        states = provider.get_spacecraft_states(["NO-SUCH-CRAFT", known])
+        
+        assert states[0].tobytes() == bytes(SPACECRAFT_STATE_DTYPE.itemsize)
+        assert states[1]["alt"] == np.float32(provider.spacecraft_data[known]["position"]["alt"])
+    
+    def test_states_are_read_only(self, provider):
+        """Test that the returned records cannot be modified"""
+        states = provider.get_spacecraft_states(list(provider.spacecraft_data))
+        
+        assert not states.flags.writeable
+        with pytest.raises(ValueError):
+            states["alt"][0] = 0.0
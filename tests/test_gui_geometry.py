@@ -0,0 +1,68 @@
+"""
+Tests for the IoST 3D viewport geometry builders
+"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add gui directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'gui'))
+
+from geometry import (
+    VERTEX_DTYPE,
+    cube_indices,
+    cube_vertices,
+    grid_vertices,
+    sphere_indices,
+    sphere_vertices,
+)
+
+
+class TestGeometry:
+    """Test vertex layout, counts and index bounds"""
+    
+    def test_vertex_layout(self):
+        """Test the interleaved vertex is 16 bytes"""
+        assert VERTEX_DTYPE.itemsize == 16
+    
+    def test_sphere(self):
+        """Test sphere vertex and strip index counts"""
+        lon_segments, lat_segments = 24, 12
+        vertices = sphere_vertices(2.0, lon_segments, lat_segments)
+        indices = sphere_indices(lon_segments, lat_segments)
+        ring = lon_segments + 1
+        
+        assert vertices.dtype == VERTEX_DTYPE
+        assert len(vertices) == (lat_segments + 1) * ring
+        np.testing.assert_allclose(
+            np.linalg.norm(vertices["pos"], axis=1), 2.0, rtol=1e-5
+        )
+        assert indices.dtype == np.uint16
+        assert len(indices) == lat_segments * (2 * ring + 2) - 2
+        assert indices.min() == 0
+        assert indices.max() == len(vertices) - 1
+    
+    def test_cube(self):
+        """Test cube vertex and triangle index counts"""
+        vertices = cube_vertices(1.0)
+        indices = cube_indices()
+        
+        assert vertices.dtype == VERTEX_DTYPE
+        assert len(vertices) == 8
+        assert np.all(np.abs(vertices["pos"]) == 0.5)
+        assert len(indices) == 36
+        assert indices.min() == 0
+        assert indices.max() == len(vertices) - 1
+    
+    def test_grid(self):
+        """Test grid line endpoints span the grid on each axis"""
+        vertices = grid_vertices(10, 2)
+        ticks = len(np.arange(-5, 6, 2))
+        
+        assert vertices.dtype == VERTEX_DTYPE
+        assert len(vertices) == 3 * ticks * ticks * 2
+        assert np.abs(vertices["pos"]).max() == 5.0
@@ -0,0 +1,60 @@
+"""
+Tests for the IoST GUI map views
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+np = pytest.importorskip("numpy")
+pytest.importorskip("pyqtgraph")
+
+# gui/main.py shares its module name with the platform entry points, so load it by path
+_GUI_MAIN = os.path.join(os.path.dirname(__file__), '..', 'gui', 'main.py')
+_spec = importlib.util.spec_from_file_location("iost_gui_main", _GUI_MAIN)
+gui_main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gui_main)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Shared QApplication for widget construction"""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestMapPlots:
+    """Test the pyqtgraph map backends"""
+    
+    def test_spacecraft_map_plot(self, qapp):
+        """Test the spacecraft map builds with the demo spacecraft"""
+        view = gui_main.SpacecraftMapPlot()
+        
+        assert len(view._labels) == len(gui_main._DEMO_SPACECRAFT)
+    
+    def test_survival_map_plot(self, qapp):
+        """Test the survival map builds its hazard image and route"""
+        view = gui_main.SurvivalMapPlot()
+        
+        assert view.image.image.shape == (400, 500)
+    
+    @pytest.mark.parametrize("backend", ["SpacecraftMapWidget", "SpacecraftMapPlot"])
+    def test_spacecraft_map_api(self, qapp, backend):
+        """Test both spacecraft map backends accept the same updates"""
+        view = getattr(gui_main, backend)()
+        
+        view.set_spacecraft(["A", "B"], [10, 20], [30, 40], ["operational", "warning"])
+        view.move_spacecraft(1, 50, 60)
+        
+        assert list(view._xs) == [10, 50]
+        assert list(view._ys) == [30, 60]
+    
+    @pytest.mark.parametrize("backend", ["SurvivalMapWidget", "SurvivalMapPlot"])
+    def test_survival_map_api(self, qapp, backend):
+        """Test both survival map backends accept a hazard grid"""
+        view = getattr(gui_main, backend)()
+        
+        view.set_hazard_map(np.zeros((40, 50), dtype=np.uint8))
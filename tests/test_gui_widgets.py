@@ -0,0 +1,53 @@
+"""
+Tests for the IoST GUI custom widgets
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+np = pytest.importorskip("numpy")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+# Add gui directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'gui'))
+
+from widgets import RealTimeChart
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Shared QApplication for widget construction"""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestRealTimeChart:
+    """Test the ring buffer and sliding-window extrema"""
+    
+    def test_partial_window(self, qapp):
+        """Test data_points before the buffer wraps"""
+        chart = RealTimeChart(max_points=10)
+        for value in (3.0, 1.0, 2.0):
+            chart.add_data_point(value)
+        
+        np.testing.assert_array_equal(chart.data_points, [3.0, 1.0, 2.0])
+        assert chart._min == 1.0
+        assert chart._max == 3.0
+    
+    def test_window_matches_numpy(self, qapp):
+        """Test data_points and extrema against numpy after wrapping"""
+        max_points = 50
+        chart = RealTimeChart(max_points=max_points)
+        values = np.random.default_rng(0).uniform(-100, 100, 3 * max_points + 7)
+        values = values.astype(np.float32)
+        
+        for i, value in enumerate(values):
+            chart.add_data_point(value)
+            window = values[max(0, i + 1 - max_points):i + 1]
+            assert chart._min == window.min()
+            assert chart._max == window.max()
+        
+        np.testing.assert_array_equal(chart.data_points, values[-max_points:])